@@ -1,19 +1,70 @@
 import hashlib
+import json
+import os
 import re
 import shutil
 import stat
 import tempfile
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, List, Optional, Tuple
 from urllib.parse import quote, unquote
 
 import click
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from tqdm import tqdm
 
 from .base import BaseCollection
 
+# Captures the last path segment of each zip href. Excluding quotes keeps a
+# match from running across a preceding non-zip href, and excluding newlines
+# keeps it within one line. Bytes, because it scans the raw listing stream.
+_ZIP_HREF_RE = re.compile(rb'href="(?:[^"\n]*/)?([^"/\n]+?\.zip)"')
+_YEAR_RE = re.compile(r'\(([0-9]{4})\)')
+_DRIVE_PREFIX_RE = re.compile(r"^[A-Za-z]:")
+
+# Large reads keep per-chunk Python and tqdm overhead negligible
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+_LISTING_CHUNK_SIZE = 256 * 1024
+
+# Downloads at least this large are split into ranges fetched in parallel
+DOWNLOAD_PARTS = 4
+_PARALLEL_DOWNLOAD_MIN_SIZE = 8 * 1024 * 1024
+# Identity encoding keeps byte offsets meaningful for range requests
+_FULL_RANGE_HEADERS = {"Range": "bytes=0-", "Accept-Encoding": "identity"}
+
+
+def _create_session() -> requests.Session:
+    """Create a pooled HTTP session with retries for transient server errors."""
+    session = requests.Session()
+    session.headers.update({
+        "User-Agent": "Mozilla/5.0",
+        "Accept-Encoding": "gzip, deflate",
+    })
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+def _year_sort_key(game: Dict) -> int:
+    """Sort key placing games without a year first."""
+    return int(game["year"] or 0)
+
+
+def _content_range_total(content_range: str) -> int:
+    """Return the total size from a 'bytes start-end/total' header, or 0."""
+    total = content_range.rpartition("/")[2]
+    return int(total) if total.isdigit() else 0
+
 
 class ArchiveOrgCollection(BaseCollection):
     """
@@ -28,6 +79,13 @@ class ArchiveOrgCollection(BaseCollection):
         self.collection_name = collection_name
         self._games_data: List[Dict] = []
         self._games_index: Dict[str, Dict] = {}
+        self._indexed_data: Optional[List[Dict]] = None
+        self._sorted_games: Dict[str, List[Dict]] = {}
+        self._url_cache: Dict[str, str] = {}
+        # Set once games.txt has been read, so an empty collection is not re-read
+        self._loaded = False
+        # Reused for every request so archive.org connections are kept alive
+        self._session = _create_session()
 
         # The download URL for a file is different from the source URL of the list.
         # We derive the base download URL from the source URL's item name.
@@ -43,29 +101,112 @@ class ArchiveOrgCollection(BaseCollection):
         cache_file = self.cache_dir / "games.txt"
         if force_refresh or not cache_file.exists():
             click.echo(f"Downloading game list from {self.source}...")
-            headers = {'User-Agent': 'Mozilla/5.0'}
-            response = requests.get(self.source, headers=headers, timeout=30)
-            response.raise_for_status()
-            self._build_games_cache(response.text, cache_file)
+            headers = {}
+            # Only revalidate when there is a local copy to fall back on;
+            # a 304 without a cache file would leave us with nothing.
+            if cache_file.exists():
+                headers.update(self._conditional_headers())
+            # Parse the listing while it streams in and build the new cache
+            # beside the old one, so a failed download never leaves a
+            # half-written games.txt behind.
+            fd, tmp_name = tempfile.mkstemp(suffix=".tmp", dir=str(self.cache_dir))
+            os.close(fd)
+            tmp_cache = Path(tmp_name)
+            try:
+                with self._session.get(
+                    self.source, headers=headers, stream=True, timeout=30
+                ) as response:
+                    response.raise_for_status()
+                    if response.status_code == 304:
+                        click.echo("✅ Game list is already up to date.")
+                        return
+                    response.raw.decode_content = True
+                    self._build_games_cache(response.raw, tmp_cache)
+                    response_headers = response.headers
+                os.replace(tmp_cache, cache_file)
+                self._save_cache_meta(response_headers)
+                # Drop everything derived from the old list; it is re-read lazily
+                self._loaded = False
+                self._sorted_games = {}
+                self._url_cache = {}
+            finally:
+                tmp_cache.unlink(missing_ok=True)
             click.echo("✅ Game list refreshed successfully.")
 
-    def _build_games_cache(self, html_content: str, cache_file: Path) -> None:
+    def _conditional_headers(self) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers from the saved validators."""
+        meta = self._load_cache_meta()
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def _load_cache_meta(self) -> Dict:
+        """Load the ETag/Last-Modified validators stored next to the cache file."""
+        meta_file = self.cache_dir / "games.txt.meta.json"
+        if not meta_file.exists():
+            return {}
+        try:
+            with open(meta_file) as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError):
+            # A corrupt sidecar just means we do an unconditional download
+            return {}
+
+    def _save_cache_meta(self, response_headers) -> None:
+        """Persist the response validators used for the next conditional GET."""
+        meta = {
+            "etag": response_headers.get("ETag"),
+            "last_modified": response_headers.get("Last-Modified"),
+        }
+        try:
+            with open(self.cache_dir / "games.txt.meta.json", "w") as f:
+                json.dump(meta, f, separators=(",", ":"))
+        except OSError as e:
+            click.echo(f"Warning: Could not save cache metadata: {e}", err=True)
+
+    def _build_games_cache(self, listing: BinaryIO, cache_file: Path) -> None:
         """
-        Parses HTML content from Archive.org and writes a pre-parsed TSV cache file.
+        Parses the Archive.org HTML listing from a binary stream and writes a
+        pre-parsed TSV cache file.
         Each line: id<TAB>name<TAB>year<TAB>full_path
         """
-        zip_hrefs = re.findall(r'href="(.+?\.zip)"', html_content)
-
         with open(cache_file, "w", encoding="utf-8") as f:
-            for href in zip_hrefs:
-                encoded_path = href.split("/")[-1]
-                full_path = unquote(encoded_path)
-                filename_with_ext = Path(full_path).name
-                parsed_details = self._parse_filename(filename_with_ext)
-                game_hash = hashlib.sha1(full_path.encode()).hexdigest()
-                game_id = game_hash[:8]
-                year = parsed_details["year"] or ""
-                f.write(f"{game_id}\t{parsed_details['name']}\t{year}\t{full_path}\n")
+            # hrefs never span lines, so each chunk is scanned up to its last
+            # newline and the remainder is carried over to the next one.
+            # A bytearray grows in place, so a line spanning many chunks (e.g.
+            # a minified listing) is not recopied on every read.
+            pending = bytearray()
+            for chunk in iter(partial(listing.read, _LISTING_CHUNK_SIZE), b""):
+                # Earlier data has no newline left, so only search the new chunk
+                search_from = len(pending)
+                pending += chunk
+                cut = pending.rfind(b"\n", search_from) + 1
+                if cut:
+                    self._write_cache_entries(f, pending[:cut])
+                    del pending[:cut]
+            self._write_cache_entries(f, pending)
+
+    def _write_cache_entries(self, f, data: bytearray) -> None:
+        """Writes a TSV cache line for every zip href found in data."""
+        for match in _ZIP_HREF_RE.finditer(data):
+            encoded_path = match.group(1).decode("utf-8", errors="replace")
+            self._write_cache_entry(f, encoded_path)
+
+    def _write_cache_entry(self, f, encoded_path: str) -> None:
+        """Writes the TSV cache line for one percent-encoded zip path."""
+        full_path = unquote(encoded_path)
+        # Archive paths always use "/", so skip building a Path per entry
+        filename_with_ext = full_path.rpartition("/")[2]
+        parsed_details = self._parse_filename(filename_with_ext)
+        # IDs are persisted in install dirs, aliases and play_config.json,
+        # so the hash must stay SHA-1. It only runs when the cache is built.
+        game_hash = hashlib.sha1(full_path.encode()).hexdigest()
+        game_id = game_hash[:8]
+        year = parsed_details["year"] or ""
+        f.write(f"{game_id}\t{parsed_details['name']}\t{year}\t{full_path}\n")
 
     def load(self, force_refresh: bool = False) -> None:
         self.ensure_cache_is_present(force_refresh=force_refresh)
@@ -80,19 +221,27 @@ class ArchiveOrgCollection(BaseCollection):
         year = None
 
         # Try to find a year like (1995) in the name
-        match = re.search(r'\(([0-9]{4})\)', name_part)
+        match = _YEAR_RE.search(name_part)
         if match:
             year = match.group(1)
 
         return {"name": name_part, "year": year}
 
     def _populate_games_data(self) -> None:
+        """
+        Loads the game list from the TSV cache.
+
+        games.txt already holds the parsed listing (IDs hashed and years
+        extracted when the cache is built), so loading it is a plain split
+        per line; no regex or hashing runs on a normal CLI invocation.
+        """
         cache_file = self.cache_dir / "games.txt"
         if not cache_file.exists():
             return
 
         self._games_data = []
-        self._games_index = {}
+        self._sorted_games = {}
+        self._url_cache = {}
         with open(cache_file, encoding="utf-8") as f:
             for line in f:
                 line = line.rstrip("\n")
@@ -105,22 +254,51 @@ class ArchiveOrgCollection(BaseCollection):
                 self._games_data.append({
                     "id": game_id,
                     "name": name,
-                    "year": year if year else None,
+                    "year": year or None,
                     "full_path": full_path,
                 })
+        self._index_games()
+        self._loaded = True
 
-    def get_games(self) -> List[Dict]:
-        if not self._games_data:
+    def get_games(self, sort_by: Optional[str] = None) -> List[Dict]:
+        """
+        Returns all games, optionally sorted by 'name' or 'year'.
+        Each sorted order is computed once per load and then reused.
+        Raises ValueError for any other sort_by value.
+        """
+        if sort_by not in (None, "name", "year"):
+            raise ValueError(f"Unknown sort order: '{sort_by}'")
+        if not self._loaded:
             self._populate_games_data()
-        return self._games_data
+        if sort_by is None:
+            return self._games_data
+
+        self._ensure_index()
+        if sort_by not in self._sorted_games:
+            if sort_by == "year":
+                key = _year_sort_key
+            else:
+                key = itemgetter("name")
+            self._sorted_games[sort_by] = sorted(self._games_data, key=key)
+        return self._sorted_games[sort_by]
+
+    def _index_games(self) -> None:
+        """Build the id->game index for the current _games_data list."""
+        self._games_index = {game["id"]: game for game in self._games_data}
+        self._indexed_data = self._games_data
+        self._sorted_games = {}
 
     def _ensure_index(self) -> None:
-        """(Re)build the id->game index when it is out of sync with _games_data."""
-        if len(self._games_index) != len(self._games_data):
-            self._games_index = {game["id"]: game for game in self._games_data}
+        """(Re)build the id->game index when _games_data has been replaced.
+
+        Tracking the indexed list by identity (rather than comparing lengths)
+        keeps lookups O(1) even when two games share an ID prefix.
+        """
+        if self._indexed_data is not self._games_data:
+            self._index_games()
 
     def find_game(self, game_id: str) -> Optional[Dict]:
-        if not self._games_data:
+        if not self._loaded:
             self._populate_games_data()
         self._ensure_index()
         return self._games_index.get(game_id)
@@ -133,10 +311,21 @@ class ArchiveOrgCollection(BaseCollection):
         game = self.find_game(game_id)
         if not game:
             return None
+        return self._url_for(game)
 
-        # The download URL is constructed from the base item name and the full path
-        encoded_full_path = quote(game["full_path"])
-        return self._build_download_url(encoded_full_path)
+    def _url_for(self, game: Dict) -> str:
+        """
+        Constructs the download URL for an already-resolved game record.
+        URLs are memoized per game ID outside the shared game records; each
+        is built on first use rather than at load time, where it would cost
+        a quote() for every game.
+        """
+        url = self._url_cache.get(game["id"])
+        if url is None:
+            # The download URL is constructed from the base item name and the full path
+            encoded_full_path = quote(game["full_path"])
+            url = self._url_cache[game["id"]] = self._build_download_url(encoded_full_path)
+        return url
 
     def _build_download_url(self, encoded_full_path: str) -> str:
         """
@@ -145,11 +334,11 @@ class ArchiveOrgCollection(BaseCollection):
         raise NotImplementedError("Subclasses must implement _build_download_url")
 
     def download_game(self, game_id: str, destination: str, force: bool = False) -> None:
-        download_url = self.get_download_url(game_id)
-        if not download_url:
+        game = self.find_game(game_id)
+        if not game:
             raise FileNotFoundError(f"Game with ID '{game_id}' not found.")
 
-        game = self.find_game(game_id)
+        download_url = self._url_for(game)
         destination_path = Path(destination)
         destination_path.mkdir(parents=True, exist_ok=True)
 
@@ -160,22 +349,33 @@ class ArchiveOrgCollection(BaseCollection):
             click.echo(f"'{filename}' already exists in '{destination_path}'. Use --force to overwrite.")
             return local_zip_path
 
-        headers = {'User-Agent': 'Mozilla/5.0'}
-
         try:
-            with requests.get(download_url, headers=headers, stream=True, timeout=30) as r:
+            # Ask for the whole file as a range. A 206 reply tells us the server
+            # supports ranges, and this connection then serves the first part.
+            r = self._session.get(
+                download_url, headers=_FULL_RANGE_HEADERS, stream=True, timeout=30
+            )
+            with r:
                 r.raise_for_status()
 
-                total_size = int(r.headers.get('content-length', 0))
-
-                bytes_written = 0
-                with tqdm.wrapattr(open(local_zip_path, "wb"), "write",
-                                 miniters=1,
-                                 total=total_size,
-                                 desc=f"Downloading '{filename}'") as fout:
-                    for chunk in r.iter_content(chunk_size=8192):
-                        fout.write(chunk)
-                        bytes_written += len(chunk)
+                if r.status_code == 206:
+                    total_size = _content_range_total(r.headers.get("content-range", ""))
+                else:
+                    total_size = int(r.headers.get('content-length', 0))
+
+                with tqdm(total=total_size, unit="B", unit_scale=True, unit_divisor=1024,
+                          miniters=1, desc=f"Downloading '{filename}'") as bar:
+                    if r.status_code == 206 and total_size >= _PARALLEL_DOWNLOAD_MIN_SIZE:
+                        bytes_written = self._download_in_parts(
+                            r, download_url, local_zip_path, total_size, bar
+                        )
+                    else:
+                        bytes_written = 0
+                        with open(local_zip_path, "wb") as fout:
+                            for chunk in r.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                                fout.write(chunk)
+                                bar.update(len(chunk))
+                                bytes_written += len(chunk)
 
             # Verify the transfer is complete. A dropped connection can end the
             # stream early, leaving a truncated (corrupt) zip that still looks
@@ -199,6 +399,76 @@ class ArchiveOrgCollection(BaseCollection):
 
         return local_zip_path
 
+    def _download_in_parts(
+        self, first_response, url: str, local_zip_path: Path, total_size: int, progress: tqdm
+    ) -> int:
+        """
+        Downloads a file as DOWNLOAD_PARTS byte ranges fetched concurrently.
+        Each part is written at its own offset of a pre-sized file.
+        Returns the number of bytes written.
+        """
+        part_size = -(-total_size // DOWNLOAD_PARTS)
+        ranges = [
+            (start, min(start + part_size, total_size) - 1)
+            for start in range(0, total_size, part_size)
+        ]
+
+        with open(local_zip_path, "wb") as f:
+            f.truncate(total_size)
+
+        stop = threading.Event()
+        with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+            futures = [
+                pool.submit(
+                    self._fetch_range, url, first_response if i == 0 else None,
+                    local_zip_path, start, end, progress, stop,
+                )
+                for i, (start, end) in enumerate(ranges)
+            ]
+            try:
+                return sum(future.result() for future in futures)
+            except BaseException:
+                # Let the other parts bail out instead of finishing their ranges
+                stop.set()
+                raise
+
+    def _fetch_range(
+        self, url: str, response, local_zip_path: Path, start: int, end: int,
+        progress, stop: threading.Event,
+    ) -> int:
+        """
+        Writes bytes start..end (inclusive) of url into local_zip_path.
+        An already-open response positioned at start can be passed in.
+        Returns the number of bytes written.
+        """
+        if response is None:
+            response = self._session.get(
+                url,
+                headers={"Range": f"bytes={start}-{end}", "Accept-Encoding": "identity"},
+                stream=True,
+                timeout=30,
+            )
+
+        remaining = end - start + 1
+        with response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise OSError(f"server ignored the range request for bytes {start}-{end}")
+
+            with open(local_zip_path, "r+b") as fout:
+                fout.seek(start)
+                for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                    if stop.is_set():
+                        break
+                    chunk = chunk[:remaining]
+                    fout.write(chunk)
+                    progress.update(len(chunk))
+                    remaining -= len(chunk)
+                    if not remaining:
+                        break
+
+        return end - start + 1 - remaining
+
     def unzip_game(self, game_id: str, download_path: Path, install_path: Path) -> None:
         """
         Unzips a downloaded game to a specified installation directory.
@@ -233,6 +503,10 @@ class ArchiveOrgCollection(BaseCollection):
         )
 
         try:
+            # Validate every entry and create the directory tree up front, so
+            # an unsafe archive is rejected before any file data is written.
+            # Keyed by target so a repeated entry still extracts last-wins.
+            files: Dict[Path, zipfile.ZipInfo] = {}
             for member in zip_ref.infolist():
                 target_path = self._validated_extract_path(
                     member.filename, install_root=temp_install_path
@@ -243,14 +517,58 @@ class ArchiveOrgCollection(BaseCollection):
                     continue
 
                 target_path.parent.mkdir(parents=True, exist_ok=True)
-                with zip_ref.open(member, "r") as source, open(target_path, "wb") as dest:
-                    shutil.copyfileobj(source, dest)
+                files[target_path] = member
 
+            self._extract_members(zip_ref, files)
             temp_install_path.rename(install_path)
         except Exception:
             shutil.rmtree(temp_install_path, ignore_errors=True)
             raise
 
+    def _extract_members(
+        self, zip_ref: zipfile.ZipFile, files: Dict[Path, zipfile.ZipInfo]
+    ) -> None:
+        """Decompress ZIP members to their targets on a thread pool.
+
+        zlib releases the GIL while inflating, so worker threads overlap the
+        CPU-bound part. Each worker reads through its own ZipFile handle
+        because a single handle shares one file position.
+
+        Members whose targets differ only in case are extracted in order by
+        one worker, so on case-insensitive filesystems the last one wins
+        instead of two threads writing the same file.
+        """
+        if len(files) < 2 or not zip_ref.filename:
+            for target_path, member in files.items():
+                with zip_ref.open(member, "r") as source, open(target_path, "wb") as dest:
+                    shutil.copyfileobj(source, dest)
+            return
+
+        local = threading.local()
+        handles: List[zipfile.ZipFile] = []
+
+        groups: Dict[str, List[Tuple[Path, zipfile.ZipInfo]]] = {}
+        for target_path, member in files.items():
+            groups.setdefault(str(target_path).casefold(), []).append((target_path, member))
+
+        def extract(group: List[Tuple[Path, zipfile.ZipInfo]]) -> None:
+            handle = getattr(local, "zip_ref", None)
+            if handle is None:
+                handle = local.zip_ref = zipfile.ZipFile(zip_ref.filename, "r")
+                handles.append(handle)
+            for target_path, member in group:
+                with handle.open(member, "r") as source, open(target_path, "wb") as dest:
+                    shutil.copyfileobj(source, dest)
+
+        try:
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+                # Consume the results so the first worker error is re-raised
+                for _ in pool.map(extract, groups.values()):
+                    pass
+        finally:
+            for handle in handles:
+                handle.close()
+
     def _validated_extract_path(self, member_name: str, install_root: Path) -> Path:
         """Return the validated extraction target for a ZIP member."""
         normalized_name = member_name.replace("\\", "/")
@@ -258,7 +576,7 @@ class ArchiveOrgCollection(BaseCollection):
         if not normalized_name or normalized_name.startswith("/"):
             raise ValueError(f"Archive contains an unsafe path: '{member_name}'")
 
-        if re.match(r"^[A-Za-z]:", normalized_name):
+        if _DRIVE_PREFIX_RE.match(normalized_name):
             raise ValueError(f"Archive contains an unsafe path: '{member_name}'")
 
         member_path = Path(normalized_name)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 
 class BaseCollection(ABC):
@@ -14,7 +14,7 @@ class BaseCollection(ABC):
         pass
 
     @abstractmethod
-    def get_games(self) -> List[Dict]:
+    def get_games(self, sort_by: Optional[str] = None) -> List[Dict]:
         pass
 
     @abstractmethod
@@ -1,9 +1,11 @@
 """Collection factory for creating appropriate collection instances."""
-from .archive_org import TotalDOSCollectionRelease14
+import importlib
 
-# Registry of available collection implementations
+# Registry of available collection implementations, as "module:class" paths.
+# Implementations are imported on first use so that loading the CLI does not
+# pull in requests/tqdm until a collection is actually needed.
 COLLECTION_REGISTRY = {
-    "tdc_release_14": TotalDOSCollectionRelease14,
+    "tdc_release_14": "dosctl.collections.archive_org:TotalDOSCollectionRelease14",
 }
 
 def create_collection(collection_type: str, source: str, cache_dir: str):
@@ -25,7 +27,8 @@ def create_collection(collection_type: str, source: str, cache_dir: str):
         available = ", ".join(COLLECTION_REGISTRY.keys())
         raise ValueError(f"Unknown collection type '{collection_type}'. Available: {available}")
 
-    collection_class = COLLECTION_REGISTRY[collection_type]
+    module_name, class_name = COLLECTION_REGISTRY[collection_type].split(":")
+    collection_class = getattr(importlib.import_module(module_name), class_name)
     return collection_class(source, cache_dir)
 
 def get_available_collections():
@@ -1,4 +1,6 @@
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 import click
 
@@ -18,7 +20,7 @@ def delete(collection, game_id):
     game_id = resolve_game_id(game_id)
     game_install_path = INSTALLED_DIR / game_id
 
-    if not game_install_path.exists() or not game_install_path.is_dir():
+    if not game_install_path.is_dir():
         click.echo(f"Error: Game with ID '{game_id}' is not installed.", err=True)
         return
 
@@ -37,13 +39,25 @@ def delete(collection, game_id):
         return
 
     try:
-        if game_install_path.exists():
-            shutil.rmtree(game_install_path)
-            click.echo("✅ Successfully deleted installation directory.")
-
+        # The install tree and the archive usually live on the same disk but
+        # are independent; remove them side by side and report each one.
+        removals = {"installation directory": partial(shutil.rmtree, game_install_path)}
         if downloaded_zip.exists():
-            downloaded_zip.unlink()
-            click.echo("✅ Successfully deleted downloaded archive.")
+            removals["downloaded archive"] = downloaded_zip.unlink
+
+        with ThreadPoolExecutor(max_workers=len(removals)) as executor:
+            futures = {label: executor.submit(task) for label, task in removals.items()}
+
+        failed = False
+        for label, future in futures.items():
+            error = future.exception()
+            if error is None:
+                click.echo(f"✅ Successfully deleted {label}.")
+            else:
+                click.echo(f"An error occurred deleting the {label}: {error}", err=True)
+                failed = True
+        if failed:
+            return
 
         removed_aliases = remove_aliases_for_game_id(game_id)
         if removed_aliases:
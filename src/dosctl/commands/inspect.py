@@ -1,8 +1,12 @@
+from itertools import chain
+
 import click
 
 from dosctl.config import INSTALLED_DIR
 from dosctl.lib.aliases import resolve_game_id
 from dosctl.lib.decorators import ensure_cache
+from dosctl.lib.executables import iter_files
+from dosctl.lib.platform import get_platform
 
 
 @click.command()
@@ -16,7 +20,7 @@ def inspect(collection, game_id, executables):
     game_id = resolve_game_id(game_id)
     game_install_path = INSTALLED_DIR / game_id
 
-    if not game_install_path.exists() or not game_install_path.is_dir():
+    if not game_install_path.is_dir():
         click.echo(f"Error: Game with ID '{game_id}' is not installed.", err=True)
         return
 
@@ -27,15 +31,15 @@ def inspect(collection, game_id, executables):
     click.echo(f"Location: {game_install_path}")
     click.echo("-" * 40)
 
-    # Use rglob to list all files recursively
-    files = sorted([f for f in game_install_path.rglob('*') if f.is_file()])
+    files = iter_files(game_install_path, sort=True)
 
     if executables:
-        # Filter to only executable file extensions
-        executable_extensions = {'.exe', '.com', '.bat'}
-        files = [f for f in files if f.suffix.lower() in executable_extensions]
+        # Same platform extensions find_executables matches
+        suffixes = tuple(f".{ext.lower()}" for ext in get_platform().get_executable_extensions())
+        files = (f for f in files if f.lower().endswith(suffixes))
 
-    if not files:
+    first = next(files, None)
+    if first is None:
         if executables:
             click.echo("No executable files found in the installation directory.")
         else:
@@ -45,7 +49,5 @@ def inspect(collection, game_id, executables):
     if executables:
         click.echo("Executable files:")
 
-    for file_path in files:
-        # Get the path relative to the game's install directory
-        relative_path = file_path.relative_to(game_install_path)
+    for relative_path in chain((first,), files):
         click.echo(f"  {relative_path}")
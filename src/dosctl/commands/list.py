@@ -1,3 +1,5 @@
+import os
+
 import click
 
 from dosctl.config import INSTALLED_DIR
@@ -5,6 +7,17 @@ from dosctl.lib.decorators import ensure_cache
 from dosctl.lib.display import display_games, sort_games
 
 
+def _installed_ids():
+    """Return the IDs of installed games (the directory names in INSTALLED_DIR)."""
+    try:
+        # DirEntry.is_dir() reuses the type from the directory listing, so
+        # this avoids a stat() per entry.
+        with os.scandir(INSTALLED_DIR) as entries:
+            return {entry.name for entry in entries if entry.is_dir()}
+    except FileNotFoundError:
+        return set()
+
+
 @click.command(name="list")
 @click.option('-s', '--sort-by', type=click.Choice(['name', 'year'], case_sensitive=False), default='name', help='Sort the list by name or year.')
 @click.option('-i', '--installed', is_flag=True, default=False, help='Only list installed games.')
@@ -12,16 +25,17 @@ from dosctl.lib.display import display_games, sort_games
 def list_games(collection, sort_by, installed):
     """Lists all available games from the local cache."""
 
-    games = collection.get_games()
-
     if installed:
-        installed_ids = {p.name for p in INSTALLED_DIR.iterdir() if p.is_dir()} if INSTALLED_DIR.exists() else set()
-        games = [g for g in games if g['id'] in installed_ids]
+        # Look up just the installed IDs rather than scanning the whole catalog
+        games = [game for game in map(collection.find_game, _installed_ids()) if game]
+        games = sort_games(games, sort_by)
+    else:
+        # The collection caches each sorted order
+        games = collection.get_games(sort_by=sort_by)
 
     if not games:
         message = "No games are currently installed." if installed else "No games found in cache."
         click.echo(message)
         return
 
-    games = sort_games(games, sort_by)
     display_games(games)
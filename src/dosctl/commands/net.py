@@ -1,14 +1,15 @@
 """Multiplayer networking commands for DOS games via IPX."""
 
-import textwrap
-
 import click
 
 from dosctl.lib.aliases import resolve_game_id
 from dosctl.lib.config_store import set_game_command
 from dosctl.lib.decorators import ensure_cache
-from dosctl.lib.discovery import encode_discovery_code, resolve_host
-from dosctl.lib.dosbox import get_dosbox_launcher, is_dosbox_installed
+from dosctl.lib.dosbox import (
+    DOSBOX_NOT_FOUND_HELP,
+    get_dosbox_launcher,
+    is_dosbox_installed,
+)
 from dosctl.lib.executables import executable_exists, get_or_prompt_command
 from dosctl.lib.game import install_game
 from dosctl.lib.network import (
@@ -19,7 +20,6 @@ from dosctl.lib.network import (
     get_public_ip,
     is_cgnat_address,
 )
-from dosctl.lib.upnp import UPnPPortMapper
 
 
 def _check_dosbox():
@@ -27,19 +27,7 @@ def _check_dosbox():
     if is_dosbox_installed():
         return True
 
-    help_text = textwrap.dedent("""
-        Error: 'dosbox' command not found in your PATH.
-
-        Please install DOSBox. We recommend DOSBox Staging for the best experience.
-
-        To install with Homebrew on macOS:
-          brew install dosbox           # For standard DOSBox
-          brew install dosbox-staging # For DOSBox Staging (recommended)
-
-        If you install DOSBox Staging, you may need to create a symlink so `dosctl` can find it:
-          ln -s "$(brew --prefix dosbox-staging)/bin/dosbox-staging" ~/.local/bin/dosbox
-    """)
-    click.echo(help_text, err=True)
+    click.echo(DOSBOX_NOT_FOUND_HELP, err=True)
     return False
 
 
@@ -55,16 +43,17 @@ def _prepare_game(collection, game_id, command_parts, configure):
     if not chosen_command_str:
         return None, None
 
-    # Save the chosen command for future runs
-    set_game_command(game_id, chosen_command_str)
-
-    # Validate that the chosen executable exists
+    # Validate that the chosen executable exists before saving it, so a bad
+    # choice costs one config write (clearing it) instead of save-then-clear
     executable_name = chosen_command_str.split()[0]
     if not executable_exists(game_install_path, executable_name):
         click.echo(f"Error: Executable '{executable_name}' not found.", err=True)
         set_game_command(game_id, None)
         return None, None
 
+    # Save the chosen command for future runs
+    set_game_command(game_id, chosen_command_str)
+
     return game_install_path, chosen_command_str
 
 
@@ -111,6 +100,10 @@ def _setup_internet_hosting(port, game_id, public_ip=None, no_upnp=False):
     Returns:
         UPnPPortMapper instance (or None) for cleanup registration.
     """
+    # Only internet hosting needs these; keep them off the LAN/--help path.
+    from dosctl.lib.discovery import encode_discovery_code
+    from dosctl.lib.upnp import UPnPPortMapper
+
     local_ip = get_local_ip()
     mapper = None
 
@@ -185,6 +178,7 @@ def _setup_internet_hosting(port, game_id, public_ip=None, no_upnp=False):
             public_ip = mapper.get_external_ip()
         if not public_ip:
             click.echo("Detecting public IP address...")
+            # Only ask an external service when the router couldn't tell us
             public_ip = get_public_ip()
 
     # Step 3: Generate and display discovery code
@@ -391,6 +385,8 @@ def join(collection, game_id, host_ip, command_parts, port, configure):
 
       dosctl net join GAME_ID DOOM-3KF8A          # Internet (discovery code)
     """
+    from dosctl.lib.discovery import resolve_host
+
     if not _check_dosbox():
         return
 
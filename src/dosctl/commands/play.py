@@ -1,11 +1,13 @@
-import textwrap
-
 import click
 
 from dosctl.lib.aliases import resolve_game_id
 from dosctl.lib.config_store import set_game_command
 from dosctl.lib.decorators import ensure_cache
-from dosctl.lib.dosbox import get_dosbox_launcher, is_dosbox_installed
+from dosctl.lib.dosbox import (
+    DOSBOX_NOT_FOUND_HELP,
+    get_dosbox_launcher,
+    is_dosbox_installed,
+)
 from dosctl.lib.executables import executable_exists, get_or_prompt_command
 from dosctl.lib.game import install_game
 
@@ -42,19 +44,7 @@ def play(collection, game_id, command_parts, configure, floppy, no_exec):
     game_id = resolve_game_id(game_id)
 
     if not is_dosbox_installed():
-        help_text = textwrap.dedent("""
-            Error: 'dosbox' command not found in your PATH.
-
-            Please install DOSBox. We recommend DOSBox Staging for the best experience.
-
-            To install with Homebrew on macOS:
-              brew install dosbox           # For standard DOSBox
-              brew install dosbox-staging # For DOSBox Staging (recommended)
-
-            If you install DOSBox Staging, you may need to create a symlink so `dosctl` can find it:
-              ln -s "$(brew --prefix dosbox-staging)/bin/dosbox-staging" ~/.local/bin/dosbox
-        """)
-        click.echo(help_text, err=True)
+        click.echo(DOSBOX_NOT_FOUND_HELP, err=True)
         return
 
     try:
@@ -89,16 +79,17 @@ def play(collection, game_id, command_parts, configure, floppy, no_exec):
             _launch_game(game_install_path, chosen_command_str, floppy=True, conf=conf)
             return
 
-        # Save the chosen command for future runs
-        set_game_command(game_id, chosen_command_str)
-
-        # Validate that the chosen executable exists
+        # Validate that the chosen executable exists before saving it, so a bad
+        # choice costs one config write (clearing it) instead of save-then-clear
         executable_name = chosen_command_str.split()[0]
         if not executable_exists(game_install_path, executable_name):
             click.echo(f"Error: Executable '{executable_name}' not found.", err=True)
             set_game_command(game_id, None)
             return
 
+        # Save the chosen command for future runs
+        set_game_command(game_id, chosen_command_str)
+
         # Launch the game
         _launch_game(game_install_path, chosen_command_str, conf=conf)
 
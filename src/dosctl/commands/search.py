@@ -3,7 +3,7 @@ import re
 import click
 
 from dosctl.lib.decorators import ensure_cache
-from dosctl.lib.display import display_games, sort_games
+from dosctl.lib.display import display_games
 
 
 @click.command()
@@ -20,31 +20,30 @@ def search(collection, query, case_sensitive, year, sort_by):
         click.echo("Error: You must provide a search query or a year.", err=True)
         return
 
-    games = collection.get_games()
+    # Pre-sorted by the collection, so the filtered results stay in order
+    games = collection.get_games(sort_by=sort_by)
 
     if not games:
         click.echo("No games found in cache.")
         return
 
     # Search Logic
-    results = []
     flags = 0 if case_sensitive else re.IGNORECASE
-
-    for game in games:
-        # Year filter
-        if year and str(game.get('year')) != str(year):
-            continue
-
-        # Name filter (only if query is provided)
-        if query and not re.search(query, game['name'], flags):
-            continue
-
-        results.append(game)
+    # Compile/convert once instead of per game; the cheap year equality runs
+    # first so the regex only sees games from the requested year. Cached
+    # years are already strings (or None), so only the option is converted.
+    name_matches = re.compile(query, flags).search if query else None
+    year_str = str(year) if year else None
+
+    results = [
+        game for game in games
+        if (year_str is None or game.get('year') == year_str)
+        and (name_matches is None or name_matches(game['name']))
+    ]
 
     # Display Logic
     if not results:
         click.echo("No games found matching your criteria.")
         return
 
-    results = sort_games(results, sort_by)
     display_games(results, f"Found {len(results)} game(s):")
@@ -23,13 +23,21 @@ IPX_CONF_PATH = CONFIG_DIR / "ipx.conf"
 DEFAULT_COLLECTION_SOURCE = "https://ia800906.us.archive.org/view_archive.php?archive=/4/items/Total_DOS_Collection_Release_14/TDC_Release_14.zip"
 
 
+_dirs_ensured = False
+
+
 def ensure_dirs_exist():
     """Create the config and data directories if they don't exist."""
+    global _dirs_ensured
+    if _dirs_ensured:
+        return
     try:
+        # DATA_DIR is created as a parent of the leaf directories
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        DATA_DIR.mkdir(parents=True, exist_ok=True)
         COLLECTION_CACHE_DIR.mkdir(parents=True, exist_ok=True)
         DOWNLOADS_DIR.mkdir(parents=True, exist_ok=True)
         INSTALLED_DIR.mkdir(parents=True, exist_ok=True)
     except PermissionError as e:
         click.echo(f"Warning: Could not create directories: {e}", err=True)
+        return
+    _dirs_ensured = True
@@ -5,6 +5,7 @@ to games by a memorable name instead of an 8-character hash ID.
 """
 
 import json
+import os
 import re
 from typing import Dict, List
 
@@ -30,8 +31,7 @@ def _load() -> Dict:
     if not ALIASES_FILE.exists():
         return {}
     try:
-        with open(ALIASES_FILE) as f:
-            return json.load(f)
+        return json.loads(ALIASES_FILE.read_bytes())
     except (json.JSONDecodeError, OSError):
         return {}
 
@@ -39,8 +39,10 @@ def _load() -> Dict:
 def _save(aliases: Dict) -> None:
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
     try:
-        with open(ALIASES_FILE, "w") as f:
-            json.dump(aliases, f, indent=2, sort_keys=True)
+        # Single write to a temp file, then an atomic swap into place
+        tmp_file = ALIASES_FILE.with_suffix(".tmp")
+        tmp_file.write_bytes(json.dumps(aliases, indent=2, sort_keys=True).encode("utf-8"))
+        os.replace(tmp_file, ALIASES_FILE)
     except OSError as e:
         click.echo(f"Warning: Could not save aliases: {e}", err=True)
 
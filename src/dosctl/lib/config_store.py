@@ -1,5 +1,7 @@
 import json
-from typing import Optional
+import os
+from contextlib import contextmanager
+from typing import Iterator, Optional
 
 import click
 
@@ -8,6 +10,14 @@ from dosctl.config import CONFIG_DIR
 CONFIG_FILE = CONFIG_DIR / "play_config.json"
 OLD_CONFIG_FILE = CONFIG_DIR / "run_config.json"
 
+# Last parsed config, keyed by (path, mtime, size) so repeated loads within a
+# command reuse it until the file changes on disk.
+_cache = {"key": None, "data": None}
+
+def _file_key(path):
+    st = os.stat(path)
+    return (str(path), st.st_mtime_ns, st.st_size)
+
 def _migrate_config():
     """Migrate old run_config.json to play_config.json if needed."""
     if OLD_CONFIG_FILE.exists() and not CONFIG_FILE.exists():
@@ -16,14 +26,19 @@ def _migrate_config():
 def load_play_config() -> dict:
     """Loads the executable configuration file."""
     _migrate_config()
-    if not CONFIG_FILE.exists():
+    try:
+        key = _file_key(CONFIG_FILE)
+    except OSError:
         return {}
+    if key == _cache["key"]:
+        return _cache["data"].copy()
     try:
-        with open(CONFIG_FILE) as f:
-            return json.load(f)
+        config = json.loads(CONFIG_FILE.read_bytes())
     except (json.JSONDecodeError, OSError):
         # If the file is corrupted or unreadable, treat it as empty
         return {}
+    _cache.update(key=key, data=config)
+    return config.copy()
 
 def save_play_config(config: dict) -> None:
     """Saves the executable configuration file."""
@@ -31,8 +46,13 @@ def save_play_config(config: dict) -> None:
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
     try:
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(config, f, indent=2)
+        # Write the whole document in one call to a temp file, then swap it
+        # in so a crash mid-write can't leave a truncated config behind
+        tmp_file = CONFIG_FILE.with_suffix(".tmp")
+        tmp_file.write_bytes(json.dumps(config, separators=(",", ":")).encode("utf-8"))
+        os.replace(tmp_file, CONFIG_FILE)
+        # Remember what we just wrote so the next load doesn't re-read it
+        _cache.update(key=_file_key(CONFIG_FILE), data=config.copy())
     except OSError as e:
         # Handle write errors gracefully
         click.echo(f"Warning: Could not save configuration: {e}", err=True)
@@ -42,13 +62,19 @@ def get_game_command(game_id: str) -> Optional[str]:
     config = load_play_config()
     return config.get(game_id)
 
-def set_game_command(game_id: str, command: Optional[str]) -> None:
-    """Saves the chosen command for a specific game. If command is None, removes the entry."""
+@contextmanager
+def config_transaction() -> Iterator[dict]:
+    """Load the play config once, yield it for changes, and save it only if it changed."""
     config = load_play_config()
+    original = config.copy()
+    yield config
+    if config != original:
+        save_play_config(config)
 
-    if command is None:
-        config.pop(game_id, None)  # Remove entry if exists
-    else:
-        config[game_id] = command
-
-    save_play_config(config)
+def set_game_command(game_id: str, command: Optional[str]) -> None:
+    """Saves the chosen command for a specific game. If command is None, removes the entry."""
+    with config_transaction() as config:
+        if command is None:
+            config.pop(game_id, None)  # Remove entry if exists
+        else:
+            config[game_id] = command
@@ -4,22 +4,42 @@ from dosctl.collections.factory import create_collection
 from dosctl.config import COLLECTION_CACHE_DIR, DEFAULT_COLLECTION_SOURCE, ensure_dirs_exist
 
 
+class CollectionProxy:
+    """
+    Stands in for the collection until a command first uses it.
+
+    The directories, collection object and cache are only set up on the
+    first attribute access, so commands that bail out early (e.g. on
+    invalid arguments) never touch the filesystem.
+    """
+
+    def __init__(self):
+        self._collection = None
+
+    def _load(self):
+        if self._collection is None:
+            ensure_dirs_exist()
+            collection = create_collection(
+                "tdc_release_14",
+                source=DEFAULT_COLLECTION_SOURCE,
+                cache_dir=COLLECTION_CACHE_DIR,
+            )
+            # This will auto-refresh if the cache is missing
+            collection.ensure_cache_is_present()
+            self._collection = collection
+        return self._collection
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+
 def ensure_cache(f):
     """
-    A decorator that ensures the game cache is present and provides the
-    collection object to the command.
+    A decorator that provides the collection object to the command, making
+    sure the game cache is present the first time the command uses it.
     """
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        ensure_dirs_exist()
-        collection = create_collection(
-            "tdc_release_14",
-            source=DEFAULT_COLLECTION_SOURCE,
-            cache_dir=COLLECTION_CACHE_DIR,
-        )
-        # This will auto-refresh if the cache is missing
-        collection.ensure_cache_is_present()
-
-        # Pass the collection object to the command
-        return f(collection, *args, **kwargs)
+        # Pass the (lazily loaded) collection object to the command
+        return f(CollectionProxy(), *args, **kwargs)
     return decorated_function
@@ -11,8 +11,6 @@ Format:
     Custom port:   WORD-NNNNN-Pxxxx  (e.g., DOOM-3KF8A-P1E4)
 """
 
-import socket
-import struct
 from pathlib import Path
 
 from .network import DEFAULT_IPX_PORT
@@ -25,12 +23,8 @@ def _load_word_list():
     Words are loaded in order and mapped to byte values 0-255.
     """
     wordlist_path = Path(__file__).parent / "wordlist.txt"
-    words = []
-    with open(wordlist_path) as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                words.extend(line.split())
+    # Line layout is only cosmetic; any whitespace separates words
+    words = wordlist_path.read_text().split()
     if len(words) != 256:
         raise RuntimeError(
             f"wordlist.txt must contain exactly 256 words, got {len(words)}"
@@ -48,30 +42,47 @@ _WORD_TO_INDEX = {word: i for i, word in enumerate(WORD_LIST)}
 # Base36 alphabet
 _B36 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 
+_B36_BYTES = _B36.encode("ascii")
+
+# Reverse lookup: base36 character -> digit value
+_B36_TO_VALUE = {ch: i for i, ch in enumerate(_B36)}
+
 
 def _to_base36(n, width):
     """Encode non-negative integer n as a zero-padded base36 string."""
     if n < 0:
         raise ValueError("n must be non-negative")
-    chars = []
-    for _ in range(width):
-        chars.append(_B36[n % 36])
-        n //= 36
+    # Fill the fixed-width buffer from the least significant digit backwards
+    digits = bytearray(width)
+    for i in range(width - 1, -1, -1):
+        n, r = divmod(n, 36)
+        digits[i] = _B36_BYTES[r]
     if n > 0:
         raise ValueError("Value too large for given width")
-    return "".join(reversed(chars))
+    return digits.decode("ascii")
 
 
 def _from_base36(s):
     """Decode a base36 string to an integer."""
     n = 0
     for ch in s.upper():
-        if ch not in _B36:
-            raise ValueError(f"Invalid base36 character: '{ch}'")
-        n = n * 36 + _B36.index(ch)
+        try:
+            n = n * 36 + _B36_TO_VALUE[ch]
+        except KeyError:
+            raise ValueError(f"Invalid base36 character: '{ch}'") from None
     return n
 
 
+def _parse_ipv4(ip):
+    """Split a dotted-quad IPv4 string into its four byte values."""
+    parts = ip.split(".")
+    if len(parts) == 4 and all(p.isascii() and p.isdigit() and len(p) <= 3 for p in parts):
+        octets = [int(p) for p in parts]
+        if max(octets) <= 255:
+            return octets
+    raise ValueError(f"Invalid IP address: '{ip}'")
+
+
 def encode_discovery_code(ip, port=DEFAULT_IPX_PORT):
     """Encode an IP address and port into a human-friendly discovery code.
 
@@ -81,10 +92,12 @@ def encode_discovery_code(ip, port=DEFAULT_IPX_PORT):
 
     Returns:
         Discovery code string (e.g., "NOVA-00ZH5").
+
+    Raises:
+        ValueError: If ip is not a dotted-quad IPv4 address.
     """
     # Parse IP into 4 bytes
-    packed = socket.inet_aton(ip)
-    a, b, c, d = struct.unpack("BBBB", packed)
+    a, b, c, d = _parse_ipv4(ip)
 
     # First byte -> word, remaining 3 bytes -> base36 (5 digits)
     word = WORD_LIST[a]
@@ -141,7 +154,7 @@ def decode_discovery_code(code):
     c = (remainder >> 8) & 0xFF
     d = remainder & 0xFF
 
-    ip = socket.inet_ntoa(struct.pack("BBBB", a, b, c, d))
+    ip = f"{a}.{b}.{c}.{d}"
 
     # Decode port
     port = DEFAULT_IPX_PORT
@@ -171,11 +184,8 @@ def resolve_host(host_arg, default_port=DEFAULT_IPX_PORT):
     """
     # If it contains a dot, treat as raw IP
     if "." in host_arg:
-        # Validate it's a real IP
-        try:
-            socket.inet_aton(host_arg)
-        except OSError:
-            raise ValueError(f"Invalid IP address: '{host_arg}'") from None
+        # Validate it's a real dotted-quad IP
+        _parse_ipv4(host_arg)
         return host_arg, default_port
 
     # Otherwise try to decode as discovery code
@@ -1,4 +1,6 @@
 """Utility functions for displaying game information."""
+from operator import itemgetter
+
 import click
 
 
@@ -7,14 +9,17 @@ def sort_games(games, sort_by='name'):
     if sort_by == 'year':
         return sorted(games, key=lambda g: int(g.get('year', 0) or 0))
     else:
-        return sorted(games, key=lambda g: g['name'])
+        return sorted(games, key=itemgetter('name'))
 
 def display_games(games, title="Available Games:"):
     """Display a list of games in a consistent format."""
     if not games:
         return
 
-    click.echo(title)
-    for game in games:
-        year_str = f"({game.get('year', '----')})"
-        click.echo(f"  [{game['id']}] {year_str} {game['name']}")
+    # Emit the whole listing in one write rather than one echo per game
+    lines = [title]
+    lines.extend(
+        f"  [{game['id']}] ({game.get('year', '----')}) {game['name']}"
+        for game in games
+    )
+    click.echo("\n".join(lines))
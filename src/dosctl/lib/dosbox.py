@@ -1,18 +1,33 @@
 """DOSBox launcher abstraction."""
 
 import subprocess
+import textwrap
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Optional
 
 from .platform import PlatformBase, get_platform
 
+DOSBOX_NOT_FOUND_HELP = textwrap.dedent("""
+    Error: 'dosbox' command not found in your PATH.
+
+    Please install DOSBox. We recommend DOSBox Staging for the best experience.
+
+    To install with Homebrew on macOS:
+      brew install dosbox           # For standard DOSBox
+      brew install dosbox-staging # For DOSBox Staging (recommended)
+
+    If you install DOSBox Staging, you may need to create a symlink so `dosctl` can find it:
+      ln -s "$(brew --prefix dosbox-staging)/bin/dosbox-staging" ~/.local/bin/dosbox
+""")
+
 
 class DOSBoxLauncher(ABC):
     """Abstract base class for DOSBox launchers."""
 
     def __init__(self, platform: PlatformBase):
         self.platform = platform
+        self._executable: Optional[str] = None
 
     @abstractmethod
     def is_available(self) -> bool:
@@ -27,11 +42,17 @@ class DOSBoxLauncher(ABC):
         pass
 
     def get_executable(self) -> str:
-        """Get the DOSBox executable path."""
-        executable = self.platform.get_dosbox_executable()
-        if not executable:
-            raise RuntimeError("DOSBox executable not found")
-        return executable
+        """Get the DOSBox executable path.
+
+        The platform's PATH search runs once; the path it returns is reused
+        for the availability check and the launch.
+        """
+        if self._executable is None:
+            executable = self.platform.get_dosbox_executable()
+            if not executable:
+                raise RuntimeError("DOSBox executable not found")
+            self._executable = executable
+        return self._executable
 
 
 class StandardDOSBoxLauncher(DOSBoxLauncher):
@@ -39,7 +60,11 @@ class StandardDOSBoxLauncher(DOSBoxLauncher):
 
     def is_available(self) -> bool:
         """Check if DOSBox is available on the system."""
-        return self.platform.get_dosbox_executable() is not None
+        try:
+            self.get_executable()
+        except RuntimeError:
+            return False
+        return True
 
     def launch_game(
         self, game_path: Path, command: Optional[str] = None, **options
@@ -97,13 +122,11 @@ class StandardDOSBoxLauncher(DOSBoxLauncher):
 
             # If the command references a subdirectory, cd into it first
             # so the game can find its data files via relative paths
-            if "\\" in dos_command.split()[0]:
-                parts = dos_command.split()[0].rsplit("\\", 1)
-                subdir = parts[0]
-                exe_name = parts[1]
+            tokens = dos_command.split()
+            if "\\" in tokens[0]:
+                subdir, exe_name = tokens[0].rsplit("\\", 1)
                 # Rebuild command with just the executable name + any original arguments
-                args = dos_command.split()[1:]
-                dos_command = " ".join([exe_name] + args)
+                dos_command = " ".join([exe_name] + tokens[1:])
                 cmd.extend(["-c", f"CD {subdir}"])
 
             cmd.extend(["-c", dos_command])
@@ -185,10 +208,14 @@ def get_dosbox_launcher() -> DOSBoxLauncher:
 
 
 def is_dosbox_available() -> bool:
-    """Check if DOSBox is available."""
+    """Check if DOSBox is available.
+
+    Goes through the singleton so the PATH lookup done here is reused by
+    the later get_dosbox_launcher() call that actually launches the game.
+    """
     try:
-        launcher = create_dosbox_launcher()
-        return launcher is not None
+        get_dosbox_launcher()
+        return True
     except Exception:
         return False
 
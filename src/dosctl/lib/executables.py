@@ -1,7 +1,9 @@
 """Utilities for handling DOS game executables."""
 
+import os
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 import click
 
@@ -9,34 +11,44 @@ from .config_store import get_game_command
 from .platform import get_platform
 
 
-def find_executables(game_path: Path) -> List[str]:
-    """Find all executable files in a game directory."""
-    platform = get_platform()
-    extensions = platform.get_executable_extensions()
+def iter_files(root, prefix: str = "", sort: bool = False) -> Iterator[str]:
+    """Yield the paths of all files under root, relative to root.
 
-    executables = []
+    Uses os.scandir so file/directory checks come from the directory entry
+    instead of a stat() per path. Unreadable directories are skipped, like
+    Path.rglob() does, and symlinked directories are not followed.
+
+    With sort=True each directory is sorted on its own, which gives the same
+    order as sorting the full list by path components without materializing
+    it.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = sorted(it, key=attrgetter("name")) if sort else list(it)
+    except OSError:
+        return
+    for entry in entries:
+        relative_path = os.path.join(prefix, entry.name) if prefix else entry.name
+        if entry.is_dir(follow_symlinks=False):
+            yield from iter_files(entry.path, relative_path, sort)
+        elif entry.is_file():
+            yield relative_path
 
-    # Use platform-specific extensions
-    for ext in extensions:
-        # Create case-insensitive patterns for each extension
-        patterns = [
-            f"**/*.{ext.lower()}",
-            f"**/*.{ext.upper()}",
-            f"**/*.{ext.capitalize()}",
-        ]
 
-        for pattern in patterns:
-            executables.extend(
-                [str(e.relative_to(game_path)) for e in game_path.glob(pattern)]
-            )
+def find_executables(game_path: Path) -> List[str]:
+    """Find all executable files in a game directory."""
+    platform = get_platform()
+    suffixes = tuple(f".{ext.lower()}" for ext in platform.get_executable_extensions())
 
-    # Remove duplicates while preserving order
+    # Single walk of the tree, matching extensions case-insensitively and
+    # dropping entries that only differ in case
     seen = set()
     unique_executables = []
-    for exe in executables:
-        if exe.lower() not in seen:
-            seen.add(exe.lower())
-            unique_executables.append(exe)
+    for relative_path in iter_files(game_path):
+        lowered = relative_path.lower()
+        if lowered.endswith(suffixes) and lowered not in seen:
+            seen.add(lowered)
+            unique_executables.append(relative_path)
 
     return sorted(unique_executables)
 
@@ -95,16 +107,15 @@ def prompt_for_executable(game_install_path, force_menu=False) -> Optional[str]:
         )
         return executables[0]
 
-    # Show menu for user selection
-    while True:
-        menu_items = [
-            f"  {i}: {exe_name.upper()}" for i, exe_name in enumerate(executables, 1)
-        ]
-        click.echo("Please choose one of the following to run:")
-        click.echo("\n".join(menu_items))
+    # Show menu for user selection; only the prompt repeats on a bad choice
+    menu_items = [
+        f"  {i}: {exe_name.upper()}" for i, exe_name in enumerate(executables, 1)
+    ]
+    click.echo("Please choose one of the following to run:")
+    click.echo("\n".join(menu_items))
 
+    while True:
         choice = click.prompt("Select a file to execute", type=int)
         if 1 <= choice <= len(executables):
             return executables[choice - 1]
-        else:
-            click.echo("Invalid choice. Please try again.", err=True)
+        click.echo("Invalid choice. Please try again.", err=True)
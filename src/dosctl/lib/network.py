@@ -1,7 +1,11 @@
 """Network configuration for DOSBox IPX multiplayer."""
 
+import contextlib
+import functools
+import queue
+import re
 import socket
-import struct
+import threading
 from dataclasses import dataclass
 from typing import Optional
 from urllib.request import Request, urlopen
@@ -41,12 +45,14 @@ class IPXClientConfig:
         return f"IPXNET CONNECT {self.host} {self.port}"
 
 
+@functools.lru_cache(maxsize=1)
 def get_local_ip() -> Optional[str]:
     """Best-effort detection of the machine's LAN IP address.
 
     Uses the UDP socket trick: connect to an external IP without sending data
     to determine which local interface would be used for outbound traffic.
-    Returns None if detection fails.
+    Returns None if detection fails. The result is cached for the lifetime
+    of the process.
     """
     try:
         with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
@@ -57,6 +63,15 @@ def get_local_ip() -> Optional[str]:
         return None
 
 
+# (netmask, network) pairs for the ranges is_cgnat_address() detects
+_NON_PUBLIC_RANGES = (
+    (0xFFC00000, 0x64400000),  # 100.64.0.0/10
+    (0xFF000000, 0x0A000000),  # 10.0.0.0/8
+    (0xFFF00000, 0xAC100000),  # 172.16.0.0/12
+    (0xFFFF0000, 0xC0A80000),  # 192.168.0.0/16
+)
+
+
 def is_cgnat_address(ip):
     """Check if an IP address is in a CGNAT or private range.
 
@@ -76,46 +91,83 @@ def is_cgnat_address(ip):
         True if the address is in a CGNAT or private range.
     """
     try:
-        addr = struct.unpack("!I", socket.inet_aton(ip))[0]
+        addr = int.from_bytes(socket.inet_aton(ip), "big")
     except OSError:
         return False
 
-    return (
-        (addr & 0xFFC00000) == 0x64400000  # 100.64.0.0/10
-        or (addr & 0xFF000000) == 0x0A000000  # 10.0.0.0/8
-        or (addr & 0xFFF00000) == 0xAC100000  # 172.16.0.0/12
-        or (addr & 0xFFFF0000) == 0xC0A80000  # 192.168.0.0/16
-    )
+    return any((addr & mask) == network for mask, network in _NON_PUBLIC_RANGES)
+
+
+# A dotted-quad IPv4 address with every octet in 0-255
+_OCTET = rb"(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])"
+_IPV4_RE = re.compile(rb"%s(?:\.%s){3}" % (_OCTET, _OCTET))
+
+# An IPv4 address is at most 15 characters; ignore anything past this
+_MAX_RESPONSE_BYTES = 64
 
+# Plain-text "what is my IP" services, in order of preference
+_PUBLIC_IP_SERVICES = (
+    "https://api.ipify.org",
+    "https://checkip.amazonaws.com",
+)
 
+# Seconds to wait on a service before also asking the next one
+_PUBLIC_IP_FALLBACK_DELAY = 1.0
+
+
+def _fetch_public_ip(url, timeout):
+    """Ask one service for our public IP; return None on any failure."""
+    try:
+        req = Request(url)
+        req.add_header("User-Agent", "dosctl")
+        with contextlib.closing(urlopen(req, timeout=timeout)) as response:
+            body = response.read(_MAX_RESPONSE_BYTES).strip()
+        # The body should be nothing but an IPv4 address
+        if _IPV4_RE.fullmatch(body):
+            return body.decode("ascii")
+        return None
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
 def get_public_ip(timeout=5):
     """Detect this machine's public IP address via an external service.
 
-    Uses https://api.ipify.org which returns the public IP as plain text.
-    Falls back to https://checkip.amazonaws.com if ipify is unreachable.
+    Asks https://api.ipify.org first. https://checkip.amazonaws.com is only
+    contacted if ipify fails or hasn't answered within a second, so a
+    healthy lookup reveals this machine to one service, while a slow or
+    blocked one doesn't hold up the other. The first valid answer wins.
 
     Args:
         timeout: Maximum seconds to wait for a response.
 
     Returns:
-        Public IP address string, or None if detection fails.
+        Public IP address string, or None if detection fails. The result is
+        cached for the lifetime of the process.
     """
-    services = [
-        "https://api.ipify.org",
-        "https://checkip.amazonaws.com",
-    ]
+    results = queue.Queue()
+
+    def fetch(url):
+        results.put(_fetch_public_ip(url, timeout))
 
-    for url in services:
+    # Daemon threads, so a slow loser never delays process exit
+    pending = 0
+    for url in _PUBLIC_IP_SERVICES:
+        threading.Thread(target=fetch, args=(url,), daemon=True).start()
+        pending += 1
         try:
-            req = Request(url)
-            req.add_header("User-Agent", "dosctl")
-            response = urlopen(req, timeout=timeout)
-            ip = response.read().decode("utf-8").strip()
-            response.close()
-            # Basic validation: should look like an IPv4 address
-            socket.inet_aton(ip)
-            return ip
-        except Exception:
+            ip = results.get(timeout=_PUBLIC_IP_FALLBACK_DELAY)
+        except queue.Empty:
             continue
+        pending -= 1
+        if ip:
+            return ip
+
+    while pending:
+        ip = results.get()
+        pending -= 1
+        if ip:
+            return ip
 
     return None
@@ -4,7 +4,10 @@ import shutil
 import sys
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Optional
+from typing import Optional, Tuple
+
+# Executable extensions DOS understands, shared by every platform
+DOS_EXECUTABLE_EXTENSIONS = ('exe', 'com', 'bat')
 
 
 class PlatformBase(ABC):
@@ -31,7 +34,7 @@ class PlatformBase(ABC):
         pass
 
     @abstractmethod
-    def get_executable_extensions(self) -> List[str]:
+    def get_executable_extensions(self) -> Tuple[str, ...]:
         """Get valid executable extensions for this platform."""
         pass
 
@@ -62,19 +65,21 @@ class UnixPlatform(PlatformBase):
     def get_dosbox_executable(self) -> Optional[str]:
         """Find DOSBox executable on Unix systems."""
         # Check for dosbox-staging first (preferred), then standard dosbox
+        # Return the resolved path so callers don't search PATH again
         candidates = ['dosbox-staging', 'dosbox']
         for candidate in candidates:
-            if shutil.which(candidate):
-                return candidate
+            path = shutil.which(candidate)
+            if path:
+                return path
         return None
 
     def format_dosbox_mount_command(self, drive: str, path: Path) -> str:
         """Format mount command for Unix DOSBox."""
         return f'MOUNT {drive} "{path}"'
 
-    def get_executable_extensions(self) -> List[str]:
+    def get_executable_extensions(self) -> Tuple[str, ...]:
         """Get DOS executable extensions."""
-        return ['exe', 'com', 'bat']
+        return DOS_EXECUTABLE_EXTENSIONS
 
 
 class MacOSPlatform(UnixPlatform):
@@ -109,11 +114,11 @@ class WindowsPlatform(PlatformBase):
 
     def get_dosbox_executable(self) -> Optional[str]:
         """Find DOSBox executable on Windows systems."""
-        # Check if DOSBox is in PATH
-        if shutil.which('dosbox.exe'):
-            return 'dosbox.exe'
-        if shutil.which('dosbox'):
-            return 'dosbox'
+        # Check if DOSBox is in PATH, returning the resolved path
+        for candidate in ('dosbox.exe', 'dosbox'):
+            path = shutil.which(candidate)
+            if path:
+                return path
 
         # Check common installation paths
         common_paths = [
@@ -136,9 +141,9 @@ class WindowsPlatform(PlatformBase):
         path_str = str(path).replace('\\', '/')
         return f'MOUNT {drive} "{path_str}"'
 
-    def get_executable_extensions(self) -> List[str]:
+    def get_executable_extensions(self) -> Tuple[str, ...]:
         """Get DOS executable extensions for Windows."""
-        return ['exe', 'com', 'bat']
+        return DOS_EXECUTABLE_EXTENSIONS
 
 
 class PlatformFactory:
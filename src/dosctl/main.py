@@ -1,19 +1,48 @@
+import importlib
+
 import click
 
 from . import __version__
-from .commands.alias import alias
-from .commands.delete import delete
-from .commands.info import info
-from .commands.inspect import inspect
-from .commands.list import list_games
-from .commands.net import net
-from .commands.play import play
-from .commands.refresh import refresh
-from .commands.search import search
-from .commands.version import version
-
-
-@click.group(invoke_without_command=True)
+
+# Subcommands are imported on first use, so running one command does not
+# pay for importing every other command's dependencies.
+_SUBCOMMANDS = {
+    "list": "dosctl.commands.list:list_games",
+    "search": "dosctl.commands.search:search",
+    "play": "dosctl.commands.play:play",
+    "inspect": "dosctl.commands.inspect:inspect",
+    "delete": "dosctl.commands.delete:delete",
+    "refresh": "dosctl.commands.refresh:refresh",
+    "net": "dosctl.commands.net:net",
+    "alias": "dosctl.commands.alias:alias",
+    "info": "dosctl.commands.info:info",
+    "version": "dosctl.commands.version:version",
+}
+
+
+class LazyGroup(click.Group):
+    """A click group that imports its subcommands on demand."""
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            module_name, attr = self.lazy_subcommands[cmd_name].split(":")
+            command = getattr(importlib.import_module(module_name), attr)
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands=_SUBCOMMANDS,
+    invoke_without_command=True,
+)
 @click.option("-v", "--version", is_flag=True, help="Show the version and exit.")
 @click.pass_context
 def cli(ctx, version):
@@ -25,16 +54,5 @@ def cli(ctx, version):
         click.echo(ctx.get_help())
 
 
-cli.add_command(list_games)
-cli.add_command(search)
-cli.add_command(play)
-cli.add_command(inspect)
-cli.add_command(delete)
-cli.add_command(refresh)
-cli.add_command(net)
-cli.add_command(alias)
-cli.add_command(info)
-cli.add_command(version)
-
 if __name__ == "__main__":
     cli()
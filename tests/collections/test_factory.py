@@ -19,6 +19,16 @@ class TestCreateCollection:
         assert "bad_type" in str(exc_info.value)
         assert "tdc_release_14" in str(exc_info.value)
 
+    def test_creates_registered_class(self, tmp_path):
+        from dosctl.collections.archive_org import TotalDOSCollectionRelease14
+
+        collection = create_collection(
+            "tdc_release_14",
+            source="https://example.com",
+            cache_dir=str(tmp_path),
+        )
+        assert isinstance(collection, TotalDOSCollectionRelease14)
+
 
 class TestGetAvailableCollections:
     def test_includes_tdc_release_14(self):
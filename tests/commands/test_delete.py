@@ -114,3 +114,33 @@ class TestDeleteSuccess:
             mock_col.return_value = _make_collection()
             result = runner.invoke(cli, ["delete", "abc12345"], input="y\n")
         assert "Doom" in result.output
+
+    def test_removes_nested_install_tree(self, tmp_path):
+        game_dir = self._setup(tmp_path)
+        (game_dir / "DATA").mkdir()
+        (game_dir / "DATA" / "level1.dat").write_bytes(b"data")
+        p1, p2, p3, p4 = _patch_dirs(tmp_path)
+        runner = CliRunner()
+        with p1, p2, p3, p4, patch("dosctl.lib.decorators.create_collection") as mock_col:
+            mock_col.return_value = _make_collection()
+            result = runner.invoke(cli, ["delete", "abc12345"], input="y\n")
+        assert not game_dir.exists()
+        assert "Successfully deleted installation directory" in result.output
+
+    def test_archive_still_removed_when_install_removal_fails(self, tmp_path):
+        game_dir = self._setup(tmp_path)
+        zip_file = tmp_path / "downloads" / "Doom.zip"
+        zip_file.write_bytes(b"zip")
+        (tmp_path / "play_config.json").write_text(json.dumps({"abc12345": "doom.exe"}))
+        p1, p2, p3, p4 = _patch_dirs(tmp_path)
+        runner = CliRunner()
+        with p1, p2, p3, p4, patch("dosctl.lib.decorators.create_collection") as mock_col, \
+                patch("dosctl.commands.delete.shutil.rmtree", side_effect=PermissionError("denied")):
+            mock_col.return_value = _make_collection()
+            result = runner.invoke(cli, ["delete", "abc12345"], input="y\n")
+        assert game_dir.exists()
+        assert not zip_file.exists()
+        assert "Successfully deleted downloaded archive" in result.output
+        assert "denied" in result.output
+        # Saved state is kept while the install is still on disk
+        assert "abc12345" in json.loads((tmp_path / "play_config.json").read_text())
@@ -1,4 +1,6 @@
 """Tests for the inspect command."""
+import os
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from click.testing import CliRunner
@@ -59,6 +61,37 @@ class TestInspectInstalledGame:
         assert "data.com" in result.output
         assert "readme.txt" not in result.output
 
+    def test_lists_relative_paths_in_path_order(self, tmp_path):
+        self._setup_game(tmp_path)
+        runner = CliRunner()
+        with patch("dosctl.lib.decorators.create_collection") as mock_col, \
+             patch("dosctl.commands.inspect.INSTALLED_DIR", tmp_path):
+            mock_col.return_value = _make_collection()
+            result = runner.invoke(cli, ["inspect", "abc12345"])
+        listed = [line.strip() for line in result.output.splitlines() if line.startswith("  ")]
+        assert listed == ["doom.exe", "readme.txt", str(Path("sub") / "data.com")]
+
+    def test_unreadable_subdirectory_is_skipped(self, tmp_path):
+        game_dir = self._setup_game(tmp_path)
+        (game_dir / "zlocked").mkdir()
+        (game_dir / "zlocked" / "secret.exe").write_text("exe")
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if os.path.basename(path) == "zlocked":
+                raise PermissionError(13, "Permission denied", path)
+            return real_scandir(path)
+
+        runner = CliRunner()
+        with patch("dosctl.lib.decorators.create_collection") as mock_col, \
+             patch("dosctl.commands.inspect.INSTALLED_DIR", tmp_path), \
+             patch("os.scandir", side_effect=scandir):
+            mock_col.return_value = _make_collection()
+            result = runner.invoke(cli, ["inspect", "abc12345"])
+        assert result.exit_code == 0
+        listed = [line.strip() for line in result.output.splitlines() if line.startswith("  ")]
+        assert listed == ["doom.exe", "readme.txt", str(Path("sub") / "data.com")]
+
     def test_empty_directory_shows_no_files_message(self, tmp_path):
         (tmp_path / "abc12345").mkdir()
         runner = CliRunner()
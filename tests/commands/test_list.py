@@ -15,3 +15,33 @@ def test_list_command_runs(mock_create_collection):
     result = runner.invoke(cli, ['list'])
     assert result.exit_code == 0
     assert "No games found" in result.output
+
+
+@patch('dosctl.lib.decorators.create_collection')
+def test_list_installed_shows_only_installed_games(mock_create_collection, tmp_path):
+    (tmp_path / "bbbb2222").mkdir()
+    (tmp_path / "stray.txt").write_text("not a game")
+    games = {
+        "aaaa1111": {"id": "aaaa1111", "name": "Alpha", "year": "1990"},
+        "bbbb2222": {"id": "bbbb2222", "name": "Beta", "year": "1992"},
+    }
+    mock_create_collection.return_value.find_game.side_effect = games.get
+
+    runner = CliRunner()
+    with patch('dosctl.commands.list.INSTALLED_DIR', tmp_path):
+        result = runner.invoke(cli, ['list', '--installed'])
+
+    assert result.exit_code == 0
+    assert "Beta" in result.output
+    assert "Alpha" not in result.output
+    mock_create_collection.return_value.get_games.assert_not_called()
+
+
+@patch('dosctl.lib.decorators.create_collection')
+def test_list_installed_without_installed_dir(mock_create_collection, tmp_path):
+    runner = CliRunner()
+    with patch('dosctl.commands.list.INSTALLED_DIR', tmp_path / "missing"):
+        result = runner.invoke(cli, ['list', '--installed'])
+
+    assert result.exit_code == 0
+    assert "No games are currently installed." in result.output
@@ -1,7 +1,9 @@
 """Tests for the net command (IPX multiplayer networking)."""
 
+import threading
 from unittest.mock import MagicMock, patch
 
+import pytest
 from click.testing import CliRunner
 
 from dosctl.lib.discovery import encode_discovery_code
@@ -44,6 +46,9 @@ class TestIPXClientConfig:
 class TestGetLocalIP:
     """Test get_local_ip function."""
 
+    def setup_method(self):
+        get_local_ip.cache_clear()
+
     @patch("dosctl.lib.network.socket.socket")
     def test_returns_ip_on_success(self, mock_socket_class):
         mock_socket = MagicMock()
@@ -70,6 +75,9 @@ class TestGetLocalIP:
 class TestGetPublicIP:
     """Test get_public_ip function."""
 
+    def setup_method(self):
+        get_public_ip.cache_clear()
+
     @patch("dosctl.lib.network.urlopen")
     def test_returns_stripped_ip_on_success(self, mock_urlopen):
         mock_response = MagicMock()
@@ -85,6 +93,80 @@ class TestGetPublicIP:
         mock_urlopen.side_effect = Exception("Network error")
         assert get_public_ip(timeout=1) is None
 
+    @pytest.mark.parametrize("body", [b"1.2", b"256.0.0.1", b"<html>203.0.113.5</html>", b""])
+    @patch("dosctl.lib.network.urlopen")
+    def test_rejects_non_ipv4_response(self, mock_urlopen, body):
+        mock_response = MagicMock()
+        mock_response.read.return_value = body
+        mock_urlopen.return_value = mock_response
+
+        assert get_public_ip(timeout=1) is None
+
+    @patch("dosctl.lib.network.urlopen")
+    def test_response_is_bounded_and_closed(self, mock_urlopen):
+        mock_response = MagicMock()
+        mock_response.read.side_effect = OSError("connection reset")
+        mock_urlopen.return_value = mock_response
+
+        assert get_public_ip(timeout=1) is None
+        mock_response.read.assert_called_with(64)
+        assert mock_response.close.call_count == 2
+
+    @patch("dosctl.lib.network.urlopen")
+    def test_result_is_cached(self, mock_urlopen):
+        mock_response = MagicMock()
+        mock_response.read.return_value = b"203.0.113.5"
+        mock_urlopen.return_value = mock_response
+
+        assert get_public_ip() == "203.0.113.5"
+        calls = mock_urlopen.call_count
+        assert get_public_ip() == "203.0.113.5"
+        assert mock_urlopen.call_count == calls
+
+    @patch("dosctl.lib.network.urlopen")
+    def test_falls_back_to_other_service(self, mock_urlopen):
+        mock_response = MagicMock()
+        mock_response.read.return_value = b"203.0.113.5"
+
+        def urlopen(req, timeout):
+            if "ipify" in req.full_url:
+                raise OSError("blocked")
+            return mock_response
+
+        mock_urlopen.side_effect = urlopen
+        assert get_public_ip(timeout=1) == "203.0.113.5"
+        assert mock_urlopen.call_count == 2
+
+    @patch("dosctl.lib.network.urlopen")
+    def test_fallback_not_contacted_when_first_service_answers(self, mock_urlopen):
+        mock_response = MagicMock()
+        mock_response.read.return_value = b"203.0.113.5"
+        mock_urlopen.return_value = mock_response
+
+        assert get_public_ip(timeout=1) == "203.0.113.5"
+        assert mock_urlopen.call_count == 1
+        assert "ipify" in mock_urlopen.call_args[0][0].full_url
+
+    @patch("dosctl.lib.network._PUBLIC_IP_FALLBACK_DELAY", 0.05)
+    @patch("dosctl.lib.network.urlopen")
+    def test_does_not_wait_for_slow_service(self, mock_urlopen):
+        release = threading.Event()
+        mock_response = MagicMock()
+        mock_response.read.return_value = b"203.0.113.5"
+
+        def urlopen(req, timeout):
+            if "ipify" in req.full_url:
+                release.wait(5)
+                raise OSError("timed out")
+            return mock_response
+
+        mock_urlopen.side_effect = urlopen
+        try:
+            assert get_public_ip(timeout=5) == "203.0.113.5"
+            assert not release.is_set()
+        finally:
+            release.set()
+
 
 # --- DOSBox launcher IPX integration tests ---
 
@@ -432,7 +514,7 @@ class TestNetGroup:
 class TestNetHostInternet:
     """Test the 'dosctl net host --internet' command."""
 
-    @patch("dosctl.commands.net.UPnPPortMapper")
+    @patch("dosctl.lib.upnp.UPnPPortMapper")
     @patch("dosctl.commands.net.get_public_ip", return_value="203.0.113.5")
     @patch("dosctl.commands.net.get_local_ip", return_value="192.168.1.100")
     @patch("dosctl.commands.net.get_dosbox_launcher")
@@ -488,7 +570,7 @@ class TestNetHostInternet:
         call_kwargs = mock_launcher.return_value.launch_game.call_args[1]
         assert isinstance(call_kwargs["ipx"], IPXServerConfig)
 
-    @patch("dosctl.commands.net.UPnPPortMapper")
+    @patch("dosctl.lib.upnp.UPnPPortMapper")
     @patch("dosctl.commands.net.get_public_ip", return_value="203.0.113.5")
     @patch("dosctl.commands.net.get_local_ip", return_value="192.168.1.100")
     @patch("dosctl.commands.net.get_dosbox_launcher")
@@ -534,7 +616,7 @@ class TestNetHostInternet:
         expected_code = encode_discovery_code("203.0.113.5")
         assert expected_code in result.output
 
-    @patch("dosctl.commands.net.UPnPPortMapper")
+    @patch("dosctl.lib.upnp.UPnPPortMapper")
     @patch("dosctl.commands.net.get_public_ip", return_value="203.0.113.5")
     @patch("dosctl.commands.net.get_local_ip", return_value="192.168.1.100")
     @patch("dosctl.commands.net.get_dosbox_launcher")
@@ -578,7 +660,7 @@ class TestNetHostInternet:
         expected_code = encode_discovery_code("203.0.113.5")
         assert expected_code in result.output
 
-    @patch("dosctl.commands.net.UPnPPortMapper")
+    @patch("dosctl.lib.upnp.UPnPPortMapper")
     @patch("dosctl.commands.net.get_public_ip", return_value="203.0.113.5")
     @patch("dosctl.commands.net.get_local_ip", return_value="192.168.1.100")
     @patch("dosctl.commands.net.get_dosbox_launcher")
@@ -622,7 +704,7 @@ class TestNetHostInternet:
         expected_code = encode_discovery_code("203.0.113.5")
         assert expected_code in result.output
 
-    @patch("dosctl.commands.net.UPnPPortMapper")
+    @patch("dosctl.lib.upnp.UPnPPortMapper")
     @patch("dosctl.commands.net.get_public_ip", return_value="203.0.113.5")
     @patch("dosctl.commands.net.get_local_ip", return_value="192.168.1.100")
     @patch("dosctl.commands.net.get_dosbox_launcher")
@@ -667,7 +749,7 @@ class TestNetHostInternet:
         expected_code = encode_discovery_code("203.0.113.5")
         assert expected_code in result.output
 
-    @patch("dosctl.commands.net.UPnPPortMapper")
+    @patch("dosctl.lib.upnp.UPnPPortMapper")
     @patch("dosctl.commands.net.get_public_ip", return_value="203.0.113.5")
     @patch("dosctl.commands.net.get_local_ip", return_value="192.168.1.100")
     @patch("dosctl.commands.net.get_dosbox_launcher")
@@ -743,6 +825,88 @@ class TestNetHostInternet:
         assert "discovery code" not in result.output.lower()
 
 
+    @patch("dosctl.lib.upnp.UPnPPortMapper")
+    @patch("dosctl.commands.net.get_public_ip", return_value="198.51.100.7")
+    @patch("dosctl.commands.net.get_local_ip", return_value="192.168.1.100")
+    @patch("dosctl.commands.net.get_dosbox_launcher")
+    @patch("dosctl.commands.net.is_dosbox_installed", return_value=True)
+    @patch("dosctl.commands.net.install_game")
+    @patch("dosctl.commands.net.executable_exists", return_value=True)
+    @patch("dosctl.commands.net.get_or_prompt_command", return_value="GAME.EXE")
+    @patch("dosctl.commands.net.set_game_command")
+    @patch("dosctl.lib.decorators.create_collection")
+    def test_host_internet_uses_upnp_ip_without_external_service(
+        self,
+        mock_collection,
+        mock_set_cmd,
+        mock_get_cmd,
+        mock_exe_exists,
+        mock_install,
+        mock_dosbox_installed,
+        mock_launcher,
+        mock_local_ip,
+        mock_public_ip,
+        mock_upnp_class,
+        tmp_path,
+    ):
+        """The external IP service is not contacted when UPnP reports the IP."""
+        runner = CliRunner()
+        game_path = tmp_path / "game"
+        game_path.mkdir()
+        mock_install.return_value = ({}, game_path)
+
+        mock_mapper = MagicMock()
+        mock_mapper.discover_gateway.return_value = True
+        mock_mapper.add_port_mapping.return_value = True
+        mock_mapper.verify_port_mapping.return_value = True
+        mock_mapper.get_external_ip.return_value = "203.0.113.5"
+        mock_upnp_class.return_value = mock_mapper
+
+        result = runner.invoke(cli, ["net", "host", "abc12345", "--internet"])
+        assert result.exit_code == 0
+        assert encode_discovery_code("203.0.113.5") in result.output
+        mock_public_ip.assert_not_called()
+
+    @patch("dosctl.lib.upnp.UPnPPortMapper")
+    @patch("dosctl.commands.net.get_public_ip", return_value="198.51.100.7")
+    @patch("dosctl.commands.net.get_local_ip", return_value="192.168.1.100")
+    @patch("dosctl.commands.net.get_dosbox_launcher")
+    @patch("dosctl.commands.net.is_dosbox_installed", return_value=True)
+    @patch("dosctl.commands.net.install_game")
+    @patch("dosctl.commands.net.executable_exists", return_value=True)
+    @patch("dosctl.commands.net.get_or_prompt_command", return_value="GAME.EXE")
+    @patch("dosctl.commands.net.set_game_command")
+    @patch("dosctl.lib.decorators.create_collection")
+    def test_host_internet_queries_external_service_without_gateway(
+        self,
+        mock_collection,
+        mock_set_cmd,
+        mock_get_cmd,
+        mock_exe_exists,
+        mock_install,
+        mock_dosbox_installed,
+        mock_launcher,
+        mock_local_ip,
+        mock_public_ip,
+        mock_upnp_class,
+        tmp_path,
+    ):
+        """Falls back to the external IP service when UPnP finds no gateway."""
+        runner = CliRunner()
+        game_path = tmp_path / "game"
+        game_path.mkdir()
+        mock_install.return_value = ({}, game_path)
+
+        mock_mapper = MagicMock()
+        mock_mapper.discover_gateway.return_value = False
+        mock_upnp_class.return_value = mock_mapper
+
+        result = runner.invoke(cli, ["net", "host", "abc12345", "--internet"])
+        assert result.exit_code == 0
+        assert encode_discovery_code("198.51.100.7") in result.output
+        mock_public_ip.assert_called_once_with()
+
+
 class TestNetJoinDiscoveryCode:
     """Test the 'dosctl net join' command with discovery codes."""
 
@@ -860,7 +1024,7 @@ class TestNetJoinDiscoveryCode:
 class TestNetHostPublicIP:
     """Test the --public-ip option for the host command."""
 
-    @patch("dosctl.commands.net.UPnPPortMapper")
+    @patch("dosctl.lib.upnp.UPnPPortMapper")
     @patch("dosctl.commands.net.get_local_ip", return_value="192.168.1.100")
     @patch("dosctl.commands.net.get_dosbox_launcher")
     @patch("dosctl.commands.net.is_dosbox_installed", return_value=True)
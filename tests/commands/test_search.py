@@ -15,3 +15,22 @@ def test_search_command_runs(mock_create_collection):
     result = runner.invoke(cli, ['search', 'test'])
     assert result.exit_code == 0
     assert "No games found" in result.output
+
+
+@patch('dosctl.lib.decorators.create_collection')
+def test_search_filters_by_year_and_query(mock_create_collection):
+    """Year and name filters should both apply, case-insensitively by default."""
+    runner = CliRunner()
+    mock_collection_instance = mock_create_collection.return_value
+    mock_collection_instance.get_games.return_value = [
+        {'id': 'a1', 'name': 'Doom', 'year': '1993'},
+        {'id': 'a2', 'name': 'Doom II', 'year': '1994'},
+        {'id': 'a3', 'name': 'Descent', 'year': '1994'},
+        {'id': 'a4', 'name': 'Unknown Doom', 'year': None},
+    ]
+
+    result = runner.invoke(cli, ['search', 'doom', '--year', '1994'])
+    assert result.exit_code == 0
+    assert "Found 1 game(s)" in result.output
+    assert "Doom II" in result.output
+    assert "Descent" not in result.output
@@ -1,14 +1,35 @@
 """Tests for the collection architecture and TotalDOSCollection backends."""
+import io
 import tempfile
 import zipfile
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
+import requests
 
 from dosctl.collections.archive_org import TotalDOSCollectionRelease14
 
 
+def _stream_response(body=b"", status=200, headers=None):
+    """Return a mock streaming HTTP response usable as a context manager.
+
+    body is either bytes or a file-like object served as the raw stream.
+    """
+    response = Mock()
+    response.status_code = status
+    response.headers = headers if headers is not None else {}
+    response.raise_for_status = Mock()
+    if isinstance(body, bytes):
+        response.raw = io.BytesIO(body)
+        response.iter_content = Mock(return_value=[body])
+    else:
+        response.raw = body
+    response.__enter__ = Mock(return_value=response)
+    response.__exit__ = Mock(return_value=None)
+    return response
+
+
 class TestArchiveOrgCollection:
     """Test the base ArchiveOrgCollection class."""
 
@@ -49,13 +70,12 @@ class TestArchiveOrgCollection:
             assert result["name"] == "SomeGame"
             assert result["year"] is None
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_ensure_cache_is_present_downloads_when_missing(self, mock_get):
         """Test that cache is downloaded when missing."""
-        mock_response = Mock()
-        mock_response.text = '<a href="Game1%20(1990).zip">Game1 (1990).zip</a>'
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = _stream_response(
+            b'<a href="Game1%20(1990).zip">Game1 (1990).zip</a>'
+        )
 
         with tempfile.TemporaryDirectory() as temp_dir:
             collection = TotalDOSCollectionRelease14(
@@ -69,6 +89,8 @@ class TestArchiveOrgCollection:
             cache_file = Path(temp_dir) / "games.txt"
             assert cache_file.exists()
             assert cache_file.read_text() == "18800512\tGame1 (1990)\t1990\tGame1 (1990).zip\n"
+            # The cache is built in a temporary file and moved into place
+            assert list(Path(temp_dir).glob("*.tmp")) == []
 
     def test_ensure_cache_is_present_skips_when_exists(self):
         """Test that cache download is skipped when file exists."""
@@ -81,10 +103,148 @@ class TestArchiveOrgCollection:
                 cache_dir=temp_dir
             )
 
-            with patch('requests.get') as mock_get:
+            with patch('requests.Session.get') as mock_get:
                 collection.ensure_cache_is_present()
                 mock_get.assert_not_called()
 
+    @patch('requests.Session.get')
+    def test_ensure_cache_is_present_saves_validators(self, mock_get):
+        """ETag and Last-Modified from the response are stored in a sidecar file."""
+        mock_get.return_value = _stream_response(
+            b'<a href="Game1%20(1990).zip">Game1 (1990).zip</a>',
+            headers={"ETag": '"abc"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            collection = TotalDOSCollectionRelease14(
+                source="https://example.com/collection",
+                cache_dir=temp_dir
+            )
+
+            collection.ensure_cache_is_present()
+
+            assert collection._load_cache_meta() == {
+                "etag": '"abc"',
+                "last_modified": "Wed, 01 Jan 2025 00:00:00 GMT",
+            }
+            # No local cache yet, so the first request must be unconditional
+            sent_headers = mock_get.call_args.kwargs["headers"]
+            assert "If-None-Match" not in sent_headers
+
+    @patch('requests.Session.get')
+    def test_ensure_cache_is_present_keeps_cache_on_304(self, mock_get):
+        """A forced refresh sends the saved validators and keeps the cache on 304."""
+        mock_get.return_value = _stream_response(status=304)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_file = Path(temp_dir) / "games.txt"
+            cache_file.write_text("existing content")
+            (Path(temp_dir) / "games.txt.meta.json").write_text(
+                '{"etag": "\\"abc\\"", "last_modified": "Wed, 01 Jan 2025 00:00:00 GMT"}'
+            )
+
+            collection = TotalDOSCollectionRelease14(
+                source="https://example.com/collection",
+                cache_dir=temp_dir
+            )
+
+            collection.ensure_cache_is_present(force_refresh=True)
+
+            sent_headers = mock_get.call_args.kwargs["headers"]
+            assert sent_headers["If-None-Match"] == '"abc"'
+            assert sent_headers["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+            assert cache_file.read_text() == "existing content"
+
+    def test_build_games_cache_finds_all_zip_hrefs(self):
+        """Every zip href is picked up, including several on the same line."""
+        listing = io.BytesIO(
+            b'<html><body>\n'
+            b'<a href="A%20(1991).zip">A</a><a href="B.zip">B</a>\n'
+            b'<a href="readme.txt">readme</a> <a href="D.zip">D</a>\n'
+            b'<a href="dir/C%20(1993).zip">C</a>\n'
+            b'</body></html>\n'
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_file = Path(temp_dir) / "games.txt"
+
+            collection = TotalDOSCollectionRelease14(
+                source="https://example.com/collection",
+                cache_dir=temp_dir
+            )
+            # Tiny chunks force hrefs to straddle chunk boundaries
+            with patch("dosctl.collections.archive_org._LISTING_CHUNK_SIZE", 7):
+                collection._build_games_cache(listing, cache_file)
+
+            rows = [line.split("\t") for line in cache_file.read_text().splitlines()]
+            assert [(name, year) for _, name, year, _ in rows] == [
+                ("A (1991)", "1991"),
+                ("B", ""),
+                ("D", ""),
+                ("C (1993)", "1993"),
+            ]
+
+    def test_build_games_cache_single_line_across_chunks(self):
+        """A listing with no newlines at all still yields every href."""
+        names = [f"Game{i}" for i in range(50)]
+        listing = io.BytesIO(
+            b"<html><body>"
+            + b"".join(f'<a href="{n}.zip">{n}</a>'.encode() for n in names)
+            + b"</body></html>"
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_file = Path(temp_dir) / "games.txt"
+
+            collection = TotalDOSCollectionRelease14(
+                source="https://example.com/collection",
+                cache_dir=temp_dir
+            )
+            with patch("dosctl.collections.archive_org._LISTING_CHUNK_SIZE", 16):
+                collection._build_games_cache(listing, cache_file)
+
+            rows = [line.split("\t") for line in cache_file.read_text().splitlines()]
+            assert [row[1] for row in rows] == names
+
+    def test_build_games_cache_handles_empty_listing(self):
+        """An empty listing produces an empty cache."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_file = Path(temp_dir) / "games.txt"
+
+            collection = TotalDOSCollectionRelease14(
+                source="https://example.com/collection",
+                cache_dir=temp_dir
+            )
+            collection._build_games_cache(io.BytesIO(b""), cache_file)
+
+            assert cache_file.read_text() == ""
+
+    @patch('requests.Session.get')
+    def test_failed_refresh_keeps_existing_cache(self, mock_get):
+        """A download that breaks mid-stream leaves the old cache untouched."""
+        class BrokenStream(io.BytesIO):
+            def read(self, size=-1):
+                data = super().read(size)
+                if not data:
+                    raise requests.ConnectionError("connection reset")
+                return data
+
+        mock_get.return_value = _stream_response(
+            BrokenStream(b'<a href="New%20(1999).zip">New</a>\n')
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_file = Path(temp_dir) / "games.txt"
+            cache_file.write_text("existing content")
+
+            collection = TotalDOSCollectionRelease14(
+                source="https://example.com/collection",
+                cache_dir=temp_dir
+            )
+            with pytest.raises(requests.ConnectionError):
+                collection.ensure_cache_is_present(force_refresh=True)
+
+            assert cache_file.read_text() == "existing content"
+            assert list(Path(temp_dir).glob("*.tmp")) == []
+
     def test_build_download_url(self):
         """Test URL building for Release 14."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -97,6 +257,25 @@ class TestArchiveOrgCollection:
             expected = "https://archive.org/download/Total_DOS_Collection_Release_14/TDC_Release_14.zip/Some%20Game.zip"
             assert url == expected
 
+    def test_get_download_url_is_memoized_per_game(self):
+        """The quoted URL is built once per game and then reused."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            collection = TotalDOSCollectionRelease14(
+                source="https://ia800906.us.archive.org/view_archive.php?archive=/4/items/Total_DOS_Collection_Release_14/TDC_Release_14.zip",
+                cache_dir=temp_dir
+            )
+            collection._games_data = [
+                {"id": "test123", "name": "Test Game", "year": "1990", "full_path": "Test Game.zip"}
+            ]
+
+            expected = "https://archive.org/download/Total_DOS_Collection_Release_14/TDC_Release_14.zip/Test%20Game.zip"
+            assert collection.get_download_url("test123") == expected
+            with patch("dosctl.collections.archive_org.quote") as mock_quote:
+                assert collection.get_download_url("test123") == expected
+            mock_quote.assert_not_called()
+            # The memo stays out of the records handed to callers
+            assert "download_url" not in collection.find_game("test123")
+
     def test_populate_games_data(self):
         """Test game data population from cache."""
         mock_content = "18800512\tGame1 (1990)\t1990\tGame1 (1990).zip\n20210409\tGame2 (1995)\t1995\tGame2 (1995).zip\n"
@@ -120,6 +299,78 @@ class TestArchiveOrgCollection:
             assert game1["full_path"] == "Game1 (1990).zip"
             assert game1["id"] == "18800512"
 
+    def test_get_games_reads_empty_cache_only_once(self):
+        """An empty game list is a valid loaded state and is not re-read on every call."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_file = Path(temp_dir) / "games.txt"
+            cache_file.write_text("")
+
+            collection = TotalDOSCollectionRelease14(
+                source="https://example.com/collection",
+                cache_dir=temp_dir
+            )
+
+            assert collection.get_games() == []
+            with patch.object(collection, "_populate_games_data") as mock_populate:
+                assert collection.get_games() == []
+                assert collection.find_game("abc12345") is None
+            mock_populate.assert_not_called()
+
+    def test_get_games_sorted_views_are_cached(self):
+        """Sorted orders are computed once and rebuilt only when the data changes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_file = Path(temp_dir) / "games.txt"
+            cache_file.write_text(
+                "11111111\tZork (1980)\t1980\tzork.zip\n"
+                "22222222\tAlpha\t\talpha.zip\n"
+                "33333333\tDoom (1993)\t1993\tdoom.zip\n"
+            )
+
+            collection = TotalDOSCollectionRelease14(
+                source="https://example.com/collection",
+                cache_dir=temp_dir
+            )
+
+            by_name = collection.get_games(sort_by="name")
+            assert [g["name"] for g in by_name] == ["Alpha", "Doom (1993)", "Zork (1980)"]
+            assert collection.get_games(sort_by="name") is by_name
+
+            by_year = collection.get_games(sort_by="year")
+            assert [g["id"] for g in by_year] == ["22222222", "11111111", "33333333"]
+
+            # Unsorted access keeps the cache file order
+            assert [g["id"] for g in collection.get_games()] == ["11111111", "22222222", "33333333"]
+
+            collection._populate_games_data()
+            assert collection.get_games(sort_by="name") is not by_name
+
+    def test_get_games_rejects_unknown_sort_order(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            collection = TotalDOSCollectionRelease14(
+                source="https://example.com/collection",
+                cache_dir=temp_dir
+            )
+            with pytest.raises(ValueError, match="Unknown sort order"):
+                collection.get_games(sort_by="nmae")
+
+    @patch('requests.Session.get')
+    def test_refresh_invalidates_sorted_views(self, mock_get):
+        """A refreshed game list is re-sorted instead of serving the old order."""
+        mock_get.return_value = _stream_response(b'<a href="Beta.zip">Beta</a>\n')
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / "games.txt").write_text("11111111\tAlpha\t\talpha.zip\n")
+            collection = TotalDOSCollectionRelease14(
+                source="https://example.com/collection",
+                cache_dir=temp_dir
+            )
+            assert [g["name"] for g in collection.get_games(sort_by="name")] == ["Alpha"]
+
+            collection.ensure_cache_is_present(force_refresh=True)
+
+            assert collection._sorted_games == {}
+            assert [g["name"] for g in collection.get_games(sort_by="name")] == ["Beta"]
+
     def test_find_game(self):
         """Test finding a game by ID."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -164,6 +415,24 @@ class TestArchiveOrgCollection:
 
             assert collection.find_game("missing") is None
 
+    def test_find_game_index_not_rebuilt_with_duplicate_ids(self):
+        """Colliding ID prefixes must not force an index rebuild on every lookup."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            collection = TotalDOSCollectionRelease14(
+                source="https://example.com/collection",
+                cache_dir=temp_dir,
+            )
+
+            collection._games_data = [
+                {"id": "aaaa1111", "name": "Alpha", "year": "1990", "full_path": "a.zip"},
+                {"id": "aaaa1111", "name": "Alpha II", "year": "1991", "full_path": "a2.zip"},
+            ]
+
+            collection.find_game("aaaa1111")
+            index_after_first = collection._games_index
+            collection.find_game("aaaa1111")
+            assert collection._games_index is index_after_first
+
     def test_find_game_index_invalidated_on_repopulate(self):
         """Re-populating the cache rebuilds the index so lookups stay correct."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -189,7 +458,42 @@ class TestArchiveOrgCollection:
             assert collection.find_game("22222222")["name"] == "New One"
             assert collection.find_game("33333333")["name"] == "New Two"
 
-    @patch("requests.get")
+    @patch("dosctl.collections.archive_org._PARALLEL_DOWNLOAD_MIN_SIZE", 0)
+    @patch("requests.Session.get")
+    def test_download_game_fetches_ranges_in_parallel(self, mock_get):
+        """Servers that honour Range get the file in parts, reassembled in order."""
+        payload = bytes(range(256)) * 40
+
+        def ranged_response(url, headers=None, **kwargs):
+            start, _, end = headers["Range"][len("bytes="):].partition("-")
+            start = int(start)
+            end = int(end) if end else len(payload) - 1
+            body = payload[start:end + 1]
+            return _stream_response(body, status=206, headers={
+                "content-length": str(len(body)),
+                "content-range": f"bytes {start}-{end}/{len(payload)}",
+            })
+
+        mock_get.side_effect = ranged_response
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            collection = TotalDOSCollectionRelease14(
+                source="https://ia800906.us.archive.org/view_archive.php?archive=/4/items/Total_DOS_Collection_Release_14/TDC_Release_14.zip",
+                cache_dir=temp_dir,
+            )
+            collection._games_data = [
+                {"id": "test123", "name": "Test Game", "year": "1990", "full_path": "TestGame.zip"}
+            ]
+
+            downloads_dir = Path(temp_dir) / "downloads"
+            result = collection.download_game("test123", str(downloads_dir))
+
+            assert result == downloads_dir / "Test Game.zip"
+            assert result.read_bytes() == payload
+            # The probe request plus one request per remaining part
+            assert mock_get.call_count == 4
+
+    @patch("requests.Session.get")
     def test_download_game_rejects_truncated_download(self, mock_get):
         """A short read vs. content-length is rejected and the partial file removed."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -202,13 +506,9 @@ class TestArchiveOrgCollection:
             ]
 
             # Server promises 100 bytes but the stream only delivers 6.
-            mock_response = Mock()
-            mock_response.raise_for_status = Mock()
-            mock_response.headers = {"content-length": "100"}
-            mock_response.iter_content = Mock(return_value=[b"only 6"])
-            mock_response.__enter__ = Mock(return_value=mock_response)
-            mock_response.__exit__ = Mock(return_value=None)
-            mock_get.return_value = mock_response
+            mock_get.return_value = _stream_response(
+                b"only 6", headers={"content-length": "100"}
+            )
 
             downloads_dir = Path(temp_dir) / "downloads"
             result = collection.download_game("test123", str(downloads_dir))
@@ -247,6 +547,63 @@ class TestArchiveOrgCollection:
             assert not install_path.exists()
             assert not outside_path.exists()
 
+    def test_unzip_game_extracts_many_entries_concurrently(self):
+        """Parallel extraction writes every file, in nested directories, intact."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            downloads_dir = temp_path / "downloads"
+            downloads_dir.mkdir()
+            install_path = temp_path / "installed" / "test123"
+
+            collection = TotalDOSCollectionRelease14(
+                source="https://example.com/collection",
+                cache_dir=temp_dir
+            )
+            collection._games_data = [{
+                "id": "test123",
+                "name": "Test Game",
+                "year": "1990",
+                "full_path": "TestGame.zip",
+            }]
+
+            expected = {f"DATA/LEVEL{i}/FILE{i}.DAT": f"level {i} " * 500 for i in range(20)}
+            with zipfile.ZipFile(downloads_dir / "Test Game.zip", "w", zipfile.ZIP_DEFLATED) as zf:
+                zf.writestr("DATA/", "")
+                for name, content in expected.items():
+                    zf.writestr(name, content)
+
+            collection.unzip_game("test123", downloads_dir, install_path)
+
+            for name, content in expected.items():
+                assert (install_path / name).read_text() == content
+
+    def test_extract_members_serializes_case_colliding_targets(self):
+        """Targets differing only in case go to one worker, in archive order."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            archive = temp_path / "game.zip"
+            with zipfile.ZipFile(archive, "w") as zf:
+                zf.writestr("GAME.EXE", "upper")
+                zf.writestr("other.dat", "other")
+                zf.writestr("game.exe", "lower")
+
+            collection = TotalDOSCollectionRelease14(
+                source="https://example.com/collection",
+                cache_dir=temp_dir
+            )
+            with zipfile.ZipFile(archive) as zf:
+                files = {temp_path / m.filename: m for m in zf.infolist()}
+                with patch("dosctl.collections.archive_org.ThreadPoolExecutor") as mock_pool:
+                    pool = mock_pool.return_value.__enter__.return_value
+                    pool.map.return_value = []
+                    collection._extract_members(zf, files)
+
+            groups = list(pool.map.call_args[0][1])
+            assert [[m.filename for _, m in group] for group in groups] == [
+                ["GAME.EXE", "game.exe"],
+                ["other.dat"],
+            ]
+
     def test_unzip_game_extracts_symlink_entries_as_regular_files(self):
         """Symlink-flagged entries should be extracted as regular files (common in DOS ZIPs)."""
         with tempfile.TemporaryDirectory() as temp_dir:
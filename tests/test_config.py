@@ -84,7 +84,8 @@ class TestConfigModule:
 
     def test_ensure_dirs_exist_handles_permission_errors(self):
         """Test that ensure_dirs_exist handles permission errors gracefully."""
-        with patch('pathlib.Path.mkdir') as mock_mkdir:
+        with patch('pathlib.Path.mkdir') as mock_mkdir, \
+             patch('dosctl.config._dirs_ensured', False):
             mock_mkdir.side_effect = PermissionError("Permission denied")
 
             # Should not raise an exception
@@ -95,6 +96,14 @@ class TestConfigModule:
             except PermissionError:
                 pytest.fail("ensure_dirs_exist should handle PermissionError gracefully")
 
+    def test_ensure_dirs_exist_runs_mkdir_once_per_process(self):
+        """Once the directories exist, later calls skip the mkdir syscalls."""
+        with patch('dosctl.config._dirs_ensured', False):
+            ensure_dirs_exist()
+            with patch('pathlib.Path.mkdir') as mock_mkdir:
+                ensure_dirs_exist()
+            mock_mkdir.assert_not_called()
+
     def test_paths_are_absolute(self):
         """Test that directory paths are absolute."""
         assert DOWNLOADS_DIR.is_absolute()
@@ -77,3 +77,54 @@ class TestSetGameCommand:
         with p1, p2:
             set_game_command("nope", None)
             assert load_play_config() == {}
+
+
+class TestConfigCache:
+    def test_repeated_loads_parse_once(self, tmp_path):
+        p1, p2, config_file, _ = _patch_files(tmp_path)
+        config_file.write_text(json.dumps({"abc12345": "doom.exe"}))
+        with p1, p2, patch("dosctl.lib.config_store.json.loads", wraps=json.loads) as mock_load:
+            assert get_game_command("abc12345") == "doom.exe"
+            assert get_game_command("abc12345") == "doom.exe"
+        assert mock_load.call_count == 1
+
+    def test_load_after_save_does_not_reread(self, tmp_path):
+        p1, p2, _, _ = _patch_files(tmp_path)
+        with p1, p2, patch("dosctl.lib.config_store.json.loads", wraps=json.loads) as mock_load:
+            set_game_command("abc12345", "doom.exe")
+            assert load_play_config() == {"abc12345": "doom.exe"}
+        mock_load.assert_not_called()
+
+    def test_external_changes_are_picked_up(self, tmp_path):
+        p1, p2, config_file, _ = _patch_files(tmp_path)
+        with p1, p2:
+            set_game_command("abc12345", "doom.exe")
+            config_file.write_text(json.dumps({"abc12345": "doom2.exe", "x": "y"}))
+            assert get_game_command("abc12345") == "doom2.exe"
+
+    def test_callers_cannot_mutate_cached_config(self, tmp_path):
+        p1, p2, config_file, _ = _patch_files(tmp_path)
+        config_file.write_text(json.dumps({"abc12345": "doom.exe"}))
+        with p1, p2:
+            load_play_config()["abc12345"] = "changed.exe"
+            assert get_game_command("abc12345") == "doom.exe"
+
+
+class TestConfigTransaction:
+    def test_unchanged_config_is_not_rewritten(self, tmp_path):
+        p1, p2, config_file, _ = _patch_files(tmp_path)
+        config_file.write_text(json.dumps({"abc12345": "doom.exe"}))
+        with p1, p2, patch("dosctl.lib.config_store.save_play_config") as mock_save:
+            set_game_command("abc12345", "doom.exe")
+            set_game_command("missing", None)
+        mock_save.assert_not_called()
+
+    def test_changes_are_saved_once(self, tmp_path):
+        from dosctl.lib.config_store import config_transaction
+
+        p1, p2, _, _ = _patch_files(tmp_path)
+        with p1, p2, patch("dosctl.lib.config_store.save_play_config") as mock_save:
+            with config_transaction() as config:
+                config["abc12345"] = "doom.exe"
+                config["def67890"] = "wolf3d.exe"
+        mock_save.assert_called_once_with({"abc12345": "doom.exe", "def67890": "wolf3d.exe"})
@@ -6,10 +6,10 @@ from dosctl.lib.decorators import ensure_cache
 
 class TestEnsureCache:
     def test_setup_sequence(self):
-        """Creates dirs, builds collection, and loads cache before calling the wrapped fn."""
+        """Creates dirs, builds collection, and loads cache on first use."""
         @ensure_cache
         def cmd(collection, **kwargs):
-            pass
+            collection.get_games()
 
         mock_collection = MagicMock()
         with patch("dosctl.lib.decorators.ensure_dirs_exist") as mock_dirs, \
@@ -20,19 +20,48 @@ class TestEnsureCache:
         mock_create.assert_called_once()
         mock_collection.ensure_cache_is_present.assert_called_once_with()
 
+    def test_unused_collection_skips_setup(self):
+        """A command that returns early never touches the filesystem."""
+        @ensure_cache
+        def cmd(collection, **kwargs):
+            pass
+
+        with patch("dosctl.lib.decorators.ensure_dirs_exist") as mock_dirs, \
+             patch("dosctl.lib.decorators.create_collection") as mock_create:
+            cmd()
+
+        mock_dirs.assert_not_called()
+        mock_create.assert_not_called()
+
+    def test_setup_runs_once(self):
+        @ensure_cache
+        def cmd(collection, **kwargs):
+            collection.find_game("a")
+            collection.find_game("b")
+
+        mock_collection = MagicMock()
+        with patch("dosctl.lib.decorators.ensure_dirs_exist"), \
+             patch("dosctl.lib.decorators.create_collection", return_value=mock_collection) as mock_create:
+            cmd()
+
+        mock_create.assert_called_once()
+        mock_collection.ensure_cache_is_present.assert_called_once_with()
+        assert mock_collection.find_game.call_count == 2
+
     def test_passes_collection_as_first_argument(self):
         received = []
 
         @ensure_cache
         def cmd(collection, **kwargs):
-            received.append(collection)
+            received.append(collection.find_game("abc"))
 
         mock_collection = MagicMock()
         with patch("dosctl.lib.decorators.ensure_dirs_exist"), \
              patch("dosctl.lib.decorators.create_collection", return_value=mock_collection):
             cmd()
 
-        assert received == [mock_collection]
+        assert received == [mock_collection.find_game.return_value]
+        mock_collection.find_game.assert_called_once_with("abc")
 
     def test_returns_inner_function_result(self):
         @ensure_cache
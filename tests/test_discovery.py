@@ -42,6 +42,9 @@ class TestBase36:
         with pytest.raises(ValueError):
             _from_base36("!!!")
 
+    def test_lowercase_accepted(self):
+        assert _from_base36("zz") == _from_base36("ZZ") == 36 * 36 - 1
+
 
 class TestEncodeDiscoveryCode:
     def test_default_port_format(self):
@@ -62,6 +65,11 @@ class TestEncodeDiscoveryCode:
         assert encode_discovery_code("10.0.0.1").split("-")[0] == WORD_LIST[10]
         assert encode_discovery_code("192.168.1.1").split("-")[0] == WORD_LIST[192]
 
+    @pytest.mark.parametrize("ip", ["10.0.0", "10.0.0.256", "10.0.0.x", "10.0.0.1.2", "10..0.1"])
+    def test_invalid_ip_raises(self, ip):
+        with pytest.raises(ValueError, match="Invalid IP"):
+            encode_discovery_code(ip)
+
 
 class TestDecodeDiscoveryCode:
     def test_default_port(self):
@@ -126,6 +134,11 @@ class TestResolveHost:
         with pytest.raises(ValueError, match="Invalid IP"):
             resolve_host("999.999.999.999")
 
+    def test_shorthand_ip_rejected(self):
+        """Only full dotted quads are passed on to DOSBox."""
+        with pytest.raises(ValueError, match="Invalid IP"):
+            resolve_host("10.1")
+
     def test_invalid_code_raises(self):
         with pytest.raises(ValueError):
             resolve_host("NOTAWORD-12345")
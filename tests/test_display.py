@@ -55,3 +55,14 @@ class TestDisplayGames:
         with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
             display_games([])
             assert mock_stdout.getvalue().strip() == ""
+
+    def test_display_games_writes_listing_once(self):
+        games = [
+            {"id": "a1", "name": "First", "year": "1990"},
+            {"id": "b2", "name": "Second", "year": "1991"},
+        ]
+        with patch("dosctl.lib.display.click.echo") as mock_echo:
+            display_games(games, "Title:")
+        mock_echo.assert_called_once_with(
+            "Title:\n  [a1] (1990) First\n  [b2] (1991) Second"
+        )
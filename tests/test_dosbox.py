@@ -0,0 +1,61 @@
+"""Tests for the DOSBox launcher lookup."""
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dosctl.lib import dosbox
+
+
+@pytest.fixture(autouse=True)
+def reset_launcher():
+    dosbox._launcher_instance = None
+    yield
+    dosbox._launcher_instance = None
+
+
+def test_availability_check_and_launcher_share_one_lookup(tmp_path):
+    platform = MagicMock()
+    platform.get_dosbox_executable.return_value = "dosbox"
+    platform.format_dosbox_mount_command.return_value = "MOUNT C game"
+    with patch("dosctl.lib.dosbox.get_platform", return_value=platform), \
+         patch("dosctl.lib.dosbox.subprocess.Popen") as mock_popen:
+        assert dosbox.is_dosbox_installed() is True
+        launcher = dosbox.get_dosbox_launcher()
+        launcher.launch_game(game_path=tmp_path, command="GAME.EXE")
+
+    assert launcher is dosbox._launcher_instance
+    assert platform.get_dosbox_executable.call_count == 1
+    mock_popen.assert_called_once()
+
+
+def test_not_installed_when_no_executable_found():
+    platform = MagicMock()
+    platform.get_dosbox_executable.return_value = None
+    with patch("dosctl.lib.dosbox.get_platform", return_value=platform):
+        assert dosbox.is_dosbox_installed() is False
+    assert dosbox._launcher_instance is None
+
+
+def test_executable_resolved_once_across_check_and_launch(tmp_path):
+    launcher = dosbox.StandardDOSBoxLauncher(MagicMock())
+    launcher.platform.get_dosbox_executable.return_value = "/usr/bin/dosbox"
+    launcher.platform.format_dosbox_mount_command.return_value = "MOUNT C game"
+
+    with patch("dosctl.lib.dosbox.subprocess.Popen") as mock_popen:
+        assert launcher.is_available() is True
+        launcher.launch_game(game_path=tmp_path, command="GAME.EXE")
+
+    launcher.platform.get_dosbox_executable.assert_called_once_with()
+    assert mock_popen.call_args[0][0][0] == "/usr/bin/dosbox"
+
+
+def test_launch_changes_into_command_subdirectory(tmp_path):
+    launcher = dosbox.StandardDOSBoxLauncher(MagicMock())
+    launcher.platform.format_dosbox_mount_command.return_value = "MOUNT C game"
+
+    with patch.object(launcher, "get_executable", return_value="dosbox"), \
+         patch("dosctl.lib.dosbox.subprocess.Popen") as mock_popen:
+        launcher.launch_game(game_path=tmp_path, command="BIN/GAME.EXE -nosound")
+
+    cmd = mock_popen.call_args[0][0]
+    assert cmd[-4:] == ["-c", "CD BIN", "-c", "GAME.EXE -nosound"]
@@ -1,8 +1,13 @@
 """Tests for executable utilities."""
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
-from dosctl.lib.executables import executable_exists, find_executables
+from dosctl.lib.executables import (
+    executable_exists,
+    find_executables,
+    prompt_for_executable,
+)
 
 
 class TestFindExecutables:
@@ -41,6 +46,14 @@ class TestFindExecutables:
         assert "main.exe" in result
         assert "subdir/sub.exe" in result
 
+    def test_matches_mixed_case_extensions_and_skips_directories(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            (temp_path / "game.eXe").write_text("")
+            (temp_path / "looks.exe").mkdir()
+            result = find_executables(temp_path)
+        assert result == ["game.eXe"]
+
 
 class TestExecutableExists:
     def test_returns_true_when_file_exists(self):
@@ -64,3 +77,15 @@ class TestExecutableExists:
             is_case_sensitive = not (temp_path / "game.exe").exists()
             if is_case_sensitive:
                 assert executable_exists(temp_path, "game.exe") is False
+
+
+class TestPromptForExecutable:
+    def test_reprompts_without_redrawing_menu(self, tmp_path):
+        (tmp_path / "game.exe").write_text("")
+        (tmp_path / "setup.exe").write_text("")
+        with patch("dosctl.lib.executables.click.prompt", side_effect=[9, 2]), \
+             patch("dosctl.lib.executables.click.echo") as mock_echo:
+            assert prompt_for_executable(tmp_path) == "setup.exe"
+        messages = [call.args[0] for call in mock_echo.call_args_list]
+        assert messages.count("Please choose one of the following to run:") == 1
+        assert "Invalid choice. Please try again." in messages
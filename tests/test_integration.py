@@ -1,4 +1,7 @@
 """Integration tests for dosctl functionality."""
+import io
+import subprocess
+import sys
 import tempfile
 import zipfile
 from pathlib import Path
@@ -11,6 +14,25 @@ from dosctl.lib import game as game_module
 from dosctl.lib.game import install_game
 
 
+def _stream_response(body=b"", status=200, headers=None):
+    """Return a mock streaming HTTP response usable as a context manager.
+
+    body is either bytes or a file-like object served as the raw stream.
+    """
+    response = Mock()
+    response.status_code = status
+    response.headers = headers if headers is not None else {}
+    response.raise_for_status = Mock()
+    if isinstance(body, bytes):
+        response.raw = io.BytesIO(body)
+        response.iter_content = Mock(return_value=[body])
+    else:
+        response.raw = body
+    response.__enter__ = Mock(return_value=response)
+    response.__exit__ = Mock(return_value=None)
+    return response
+
+
 class TestIntegration:
     """Integration tests covering end-to-end functionality."""
 
@@ -116,11 +138,8 @@ class TestIntegration:
             assert not cache_file.exists()
 
             # Mock successful HTTP request
-            with patch('requests.get') as mock_get:
-                mock_response = Mock()
-                mock_response.text = '<a href="game.zip">game.zip</a>'
-                mock_response.raise_for_status = Mock()
-                mock_get.return_value = mock_response
+            with patch('requests.Session.get') as mock_get:
+                mock_get.return_value = _stream_response(b'<a href="game.zip">game.zip</a>')
 
                 collection.ensure_cache_is_present()
 
@@ -240,15 +259,10 @@ class TestIntegration:
 
                 # Mock the HTTP request for download
                 mock_content = b"fake zip content"
-                with patch('requests.get') as mock_get:
-                    mock_response = Mock()
-                    mock_response.content = mock_content
-                    mock_response.raise_for_status = Mock()
-                    mock_response.headers = {'content-length': str(len(mock_content))}
-                    mock_response.iter_content = Mock(return_value=[mock_content])
-                    mock_response.__enter__ = Mock(return_value=mock_response)
-                    mock_response.__exit__ = Mock(return_value=None)
-                    mock_get.return_value = mock_response
+                with patch('requests.Session.get') as mock_get:
+                    mock_get.return_value = _stream_response(
+                        mock_content, headers={'content-length': str(len(mock_content))}
+                    )
 
                     # Test download
                     download_path = collection.download_game("test123", str(downloads_dir))
@@ -256,3 +270,21 @@ class TestIntegration:
                     assert download_path is not None
                     assert Path(download_path).exists()
                     assert Path(download_path).read_bytes() == mock_content
+
+    def test_cli_imports_only_the_invoked_command(self):
+        """Running one subcommand should not import the other command modules."""
+        script = (
+            "import sys\n"
+            "from dosctl.main import cli\n"
+            "try:\n"
+            "    cli(['version'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(sorted(m for m in sys.modules if m.startswith('dosctl.commands.')))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        )
+        assert "dosctl.commands.version" in result.stdout
+        assert "dosctl.commands.net" not in result.stdout
+        assert "dosctl.commands.play" not in result.stdout
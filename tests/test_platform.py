@@ -28,7 +28,7 @@ class TestUnixPlatform:
 
     def test_get_dosbox_executable_found(self):
         with patch("shutil.which", return_value="/usr/bin/dosbox-staging"):
-            assert self.platform.get_dosbox_executable() == "dosbox-staging"
+            assert self.platform.get_dosbox_executable() == "/usr/bin/dosbox-staging"
 
     def test_get_dosbox_executable_not_found(self):
         with patch("shutil.which", return_value=None):
@@ -53,8 +53,8 @@ class TestWindowsPlatform:
         assert "\\" not in result.split('"')[1]
 
     def test_get_dosbox_executable_in_path(self):
-        with patch("shutil.which", return_value="dosbox.exe"):
-            assert self.platform.get_dosbox_executable() == "dosbox.exe"
+        with patch("shutil.which", return_value="C:\\DOSBox\\dosbox.exe"):
+            assert self.platform.get_dosbox_executable() == "C:\\DOSBox\\dosbox.exe"
 
 
 class TestPlatformFactory: